@@ -6,16 +6,79 @@ This module provides functionality to load, parse, and query CVE vulnerabilities
 for various Ethereum client implementations based on their versions.
 """
 
+import functools
 import json
 import os
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import sqlite3
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from dataclasses import dataclass
+from enum import IntEnum
 from packaging import version
 from packaging.version import Version
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
 
-@dataclass
+# Common client name variations mapped to the keys used in the database
+_ALIASES = {
+    'go-ethereum': 'geth',
+    'parity-ethereum': 'parity',
+    'parity/openethereum': 'parity',  # Name reported by the fingerprinter
+    'openethereum': 'parity',  # OpenEthereum is the successor to Parity
+    'hyperledger-besu': 'besu',
+    'nethermind': 'nethermind',
+    'erigon': 'erigon',
+    'reth': 'reth'
+}
+
+# Version parsing patterns, compiled once at import
+_SIMPLE_VERSION_RE = re.compile(r'[vV]?(\d+\.\d+\.\d+)(?:-(?:stable|beta|alpha|rc\d*|unstable).*|\+.*)?')
+_V_PREFIX_RE = re.compile(r'^[vV]')
+_PRERELEASE_SUFFIX_RE = re.compile(r'-(stable|beta|alpha|rc\d*|unstable).*$')
+_BUILD_METADATA_RE = re.compile(r'\+.*$')
+_LEADING_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+')
+_VERSION_SEARCH_RE = re.compile(r'(\d+\.\d+\.\d+)')
+
+# Maximum number of (software, version) lookups remembered by check_vulnerabilities
+_CHECK_CACHE_SIZE = 10_000
+
+# Schema of the SQLite form of the database, produced by import_json()
+_SQLITE_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value BLOB);
+CREATE TABLE vulns (
+    software TEXT,
+    cve_id TEXT,
+    severity TEXT,
+    cvss REAL,
+    vmin TEXT,
+    vmax TEXT,
+    fixed_in TEXT,
+    payload BLOB
+);
+CREATE INDEX idx_sw ON vulns(software);
+CREATE INDEX idx_cve ON vulns(cve_id);
+"""
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class Severity(IntEnum):
+    """Severity levels, ordered from least to most severe."""
+    NONE = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Vulnerability:
     """Represents a single CVE vulnerability."""
     cve_id: str
@@ -38,14 +101,20 @@ class Vulnerability:
         valid_severities = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
         if self.severity not in valid_severities:
             raise ValueError(f"Severity must be one of {valid_severities}, got {self.severity}")
+    
+    @property
+    def severity_rank(self) -> Severity:
+        """Severity as a comparable enum member."""
+        return Severity[self.severity]
 
 
 class CVEDatabase:
     """
     Manages CVE database operations for Ethereum RPC implementations.
     
-    This class loads vulnerability data from a JSON database and provides
-    methods to query vulnerabilities based on software implementation and version.
+    This class loads vulnerability data from a JSON database (or from a SQLite
+    file built with import_json) and provides methods to query vulnerabilities
+    based on software implementation and version.
     """
     
     def __init__(self, database_path: Optional[str] = None):
@@ -53,7 +122,8 @@ class CVEDatabase:
         Initialize CVE database.
         
         Args:
-            database_path: Path to the CVE JSON database file. If None, uses default.
+            database_path: Path to the CVE JSON database file, or to a ``.db`` SQLite
+                file built with import_json. If None, uses the bundled JSON file.
         """
         if database_path is None:
             # Default to cve_database.json in the same directory as this module
@@ -64,10 +134,36 @@ class CVEDatabase:
         else:
             self.database_path = database_path
         
+        self._reset()
+        self._load_database()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CVEDatabase':
+        """
+        Create a CVE database from already parsed data instead of a file.
+        
+        Args:
+            data: Dictionary with the same layout as the JSON database file
+            
+        Returns:
+            CVEDatabase populated from the given data
+        """
+        cve_db = cls.__new__(cls)
+        cve_db.database_path = None
+        cve_db._reset()
+        cve_db._ingest(data)
+        return cve_db
+    
+    def _reset(self) -> None:
+        """Set up the empty data, indexes and caches shared by every way of loading a database."""
         self.vulnerabilities: Dict[str, List[Vulnerability]] = {}
         self.metadata: Dict[str, Any] = {}
         self.severity_mapping: Dict[str, Dict[str, Any]] = {}
-        self._load_database()
+        self._check_cache: Dict[Tuple[str, str], List[Vulnerability]] = {}
+        self._by_cve: Optional[Dict[str, Tuple[str, Vulnerability]]] = None
+        self._search_entries: Optional[List[Tuple[str, str, Vulnerability]]] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_lock = threading.Lock()
     
     def _load_database(self) -> None:
         """Load and parse the CVE database from JSON file."""
@@ -75,9 +171,121 @@ class CVEDatabase:
             if not os.path.exists(self.database_path):
                 raise FileNotFoundError(f"CVE database file not found: {self.database_path}")
             
-            with open(self.database_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if self.database_path.endswith('.db'):
+                self._open_sqlite()
+                return
+            
+            with open(self.database_path, 'rb') as f:
+                data = _json_loads(f.read())
+        
+        except (FileNotFoundError, json.JSONDecodeError, sqlite3.Error) as e:
+            print(f"Error loading CVE database: {e}")
+            return
+        
+        self._ingest(data)
+    
+    def _open_sqlite(self) -> None:
+        """
+        Open a SQLite database built with import_json.
+        
+        Only metadata is read up front; vulnerabilities are fetched per software
+        on first use.
+        """
+        connection = sqlite3.connect(self.database_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA mmap_size=268435456")
+        
+        meta = dict(connection.execute("SELECT key, value FROM meta"))
+        self.metadata = _json_loads(meta.get('metadata', '{}'))
+        self.severity_mapping = _json_loads(meta.get('severity_mapping', '{}'))
+        self._connection = connection
+    
+    def close(self) -> None:
+        """Close the SQLite connection of a database opened from a ``.db`` file, if any."""
+        with self._connection_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def _software_vulnerabilities(self, software: str) -> List[Vulnerability]:
+        """
+        Get the vulnerabilities stored for a normalized software name.
+        
+        Args:
+            software: Normalized software name
+            
+        Returns:
+            List of vulnerabilities for the software (empty if unknown)
+        """
+        vulns = self.vulnerabilities.get(software)
+        if vulns is not None or self._connection is None:
+            return vulns if vulns is not None else []
+        
+        with self._connection_lock:
+            rows = self._connection.execute(
+                "SELECT payload FROM vulns WHERE software = ?", (software,)
+            ).fetchall()
+        
+        vulns = []
+        for (payload,) in rows:
+            vulnerability = self._build_vulnerability(software, _json_loads(payload))
+            if vulnerability is not None:
+                vulns.append(vulnerability)
+        
+        if vulns:
+            self.vulnerabilities[software] = vulns
+        return vulns
+    
+    def _load_all_software(self) -> None:
+        """Fetch every software's vulnerabilities from SQLite, if backed by it."""
+        if self._connection is None:
+            return
+        
+        with self._connection_lock:
+            software_names = [row[0] for row in self._connection.execute(
+                "SELECT DISTINCT software FROM vulns"
+            )]
+        for software in software_names:
+            self._software_vulnerabilities(software)
+    
+    @staticmethod
+    def _build_vulnerability(software: str, vuln_data: Dict[str, Any]) -> Optional[Vulnerability]:
+        """
+        Build a Vulnerability from its raw dictionary form.
+        
+        Args:
+            software: Software the vulnerability belongs to (used in warnings)
+            vuln_data: Raw vulnerability entry
             
+        Returns:
+            Vulnerability, or None if the entry is malformed
+        """
+        try:
+            return Vulnerability(
+                cve_id=vuln_data['cve_id'],
+                title=vuln_data['title'],
+                description=vuln_data['description'],
+                severity=vuln_data['severity'],
+                cvss_score=float(vuln_data['cvss_score']),
+                affected_versions=vuln_data['affected_versions'],
+                fixed_in=vuln_data['fixed_in'],
+                published_date=vuln_data['published_date'],
+                references=vuln_data['references'],
+                impact=vuln_data['impact'],
+                recommendation=vuln_data['recommendation']
+            )
+        except (KeyError, ValueError) as e:
+            print(f"Warning: Skipping malformed vulnerability in {software}: {e}")
+            return None
+    
+    def _ingest(self, data: Dict[str, Any]) -> None:
+        """
+        Populate the database from parsed JSON data.
+        
+        Args:
+            data: Dictionary with metadata, severity_mapping and vulnerabilities sections
+        """
+        try:
             # Load metadata
             self.metadata = data.get('metadata', {})
             self.severity_mapping = data.get('severity_mapping', {})
@@ -85,35 +293,23 @@ class CVEDatabase:
             # Parse vulnerabilities
             vulnerabilities_data = data.get('vulnerabilities', {})
             for software, vulns in vulnerabilities_data.items():
-                self.vulnerabilities[software.lower()] = []
+                # Key by canonical name so aliases ("go-ethereum", "Geth") share one entry
+                software_vulns = self.vulnerabilities.setdefault(self._normalize_software_name(software), [])
                 for vuln_data in vulns:
-                    try:
-                        vulnerability = Vulnerability(
-                            cve_id=vuln_data['cve_id'],
-                            title=vuln_data['title'],
-                            description=vuln_data['description'],
-                            severity=vuln_data['severity'],
-                            cvss_score=float(vuln_data['cvss_score']),
-                            affected_versions=vuln_data['affected_versions'],
-                            fixed_in=vuln_data['fixed_in'],
-                            published_date=vuln_data['published_date'],
-                            references=vuln_data['references'],
-                            impact=vuln_data['impact'],
-                            recommendation=vuln_data['recommendation']
-                        )
-                        self.vulnerabilities[software.lower()].append(vulnerability)
-                    except (KeyError, ValueError) as e:
-                        print(f"Warning: Skipping malformed vulnerability in {software}: {e}")
-                        continue
-        
-        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+                    vulnerability = self._build_vulnerability(software, vuln_data)
+                    if vulnerability is not None:
+                        software_vulns.append(vulnerability)
+        
+        except KeyError as e:
             print(f"Error loading CVE database: {e}")
             # Initialize with empty data if database fails to load
             self.vulnerabilities = {}
             self.metadata = {}
             self.severity_mapping = {}
     
-    def _normalize_software_name(self, software_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _normalize_software_name(software_name: str) -> str:
         """
         Normalize software name for consistent lookup.
         
@@ -123,23 +319,17 @@ class CVEDatabase:
         Returns:
             Normalized software name for database lookup
         """
-        software_lower = software_name.lower()
-        
-        # Handle common name variations
-        name_mappings = {
-            'go-ethereum': 'geth',
-            'parity-ethereum': 'parity',
-            'openethereum': 'parity',  # OpenEthereum is the successor to Parity
-            'hyperledger_besu': 'besu',
-            'hyperledger-besu': 'besu',
-            'nethermind': 'nethermind',
-            'erigon': 'erigon',
-            'reth': 'reth'
-        }
+        software_lower = software_name.strip().lower()
         
-        return name_mappings.get(software_lower, software_lower)
+        canonical = _ALIASES.get(software_lower)
+        if canonical is None:
+            # Accept underscore spellings such as "hyperledger_besu"
+            canonical = _ALIASES.get(software_lower.replace('_', '-'), software_lower)
+        return canonical
     
-    def _parse_version(self, version_string: str) -> Optional[Version]:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_version(version_string: str) -> Optional[Version]:
         """
         Parse version string into a comparable version object.
         
@@ -150,18 +340,24 @@ class CVEDatabase:
             Parsed version object or None if parsing fails
         """
         try:
-            # Remove common prefixes and suffixes
             clean_version = version_string.strip()
-            clean_version = re.sub(r'^[vV]', '', clean_version)  # Remove 'v' or 'V' prefix
-            clean_version = re.sub(r'-(stable|beta|alpha|rc\d*|unstable).*$', '', clean_version)
-            clean_version = re.sub(r'\+.*$', '', clean_version)  # Remove build metadata
+            
+            # Fast path for the common "v1.2.3", "1.2.3-stable" and "1.2.3+build" shapes
+            fast_match = _SIMPLE_VERSION_RE.fullmatch(clean_version)
+            if fast_match:
+                return version.parse(fast_match.group(1))
+            
+            # Remove common prefixes and suffixes
+            clean_version = _V_PREFIX_RE.sub('', clean_version)  # Remove 'v' or 'V' prefix
+            clean_version = _PRERELEASE_SUFFIX_RE.sub('', clean_version)
+            clean_version = _BUILD_METADATA_RE.sub('', clean_version)  # Remove build metadata
             
             # Handle common version formats
-            if re.match(r'^\d+\.\d+\.\d+', clean_version):
+            if _LEADING_VERSION_RE.match(clean_version):
                 return version.parse(clean_version)
             else:
                 # Try to extract version pattern
-                version_match = re.search(r'(\d+\.\d+\.\d+)', clean_version)
+                version_match = _VERSION_SEARCH_RE.search(clean_version)
                 if version_match:
                     return version.parse(version_match.group(1))
         except Exception:
@@ -227,16 +423,67 @@ class CVEDatabase:
             List of vulnerabilities affecting the given software version
         """
         normalized_name = self._normalize_software_name(software_name)
-        software_vulns = self.vulnerabilities.get(normalized_name, [])
+        return list(self._affected_vulnerabilities(normalized_name, software_version))
+    
+    def check_vulnerabilities_batch(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Vulnerability]]:
+        """
+        Check many (software, version) pairs at once.
+        
+        Each distinct software name is normalized only once, and repeated pairs
+        are evaluated only once.
+        
+        Args:
+            pairs: Iterable of (software_name, software_version) tuples
+            
+        Returns:
+            Dictionary mapping each given pair to the vulnerabilities affecting it,
+            in the same order as check_vulnerabilities would return them
+        """
+        normalized_names: Dict[str, str] = {}
+        results: Dict[Tuple[str, str], List[Vulnerability]] = {}
+        
+        for software_name, software_version in pairs:
+            pair = (software_name, software_version)
+            if pair in results:
+                continue
+            
+            normalized_name = normalized_names.get(software_name)
+            if normalized_name is None:
+                normalized_name = normalized_names[software_name] = self._normalize_software_name(software_name)
+            results[pair] = list(self._affected_vulnerabilities(normalized_name, software_version))
+        
+        return results
+    
+    def _affected_vulnerabilities(self, normalized_name: str, software_version: str) -> List[Vulnerability]:
+        """
+        Compute (or fetch from the cache) the sorted vulnerabilities for a version.
+        
+        Args:
+            normalized_name: Software name already passed through _normalize_software_name
+            software_version: Version string
+            
+        Returns:
+            The cached result list itself; callers must copy it before handing it out
+        """
+        cache_key = (normalized_name, software_version)
+        cached = self._check_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        software_vulns = self._software_vulnerabilities(normalized_name)
         
         affected_vulns = []
         for vuln in software_vulns:
             if self._is_version_affected(software_version, vuln.affected_versions):
                 affected_vulns.append(vuln)
         
-        # Sort by severity (CRITICAL first, then HIGH, MEDIUM, LOW)
-        severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
-        affected_vulns.sort(key=lambda v: (severity_order.get(v.severity, 4), -v.cvss_score))
+        # Sort by severity (CRITICAL first, then HIGH, MEDIUM, LOW), then by CVSS score
+        affected_vulns.sort(key=lambda v: (v.severity_rank, v.cvss_score), reverse=True)
+        
+        # Remember the result, evicting the oldest entry once the cache is full
+        if len(self._check_cache) >= _CHECK_CACHE_SIZE:
+            self._check_cache.pop(next(iter(self._check_cache)))
+        self._check_cache[cache_key] = affected_vulns
         
         return affected_vulns
     
@@ -264,6 +511,7 @@ class CVEDatabase:
         Returns:
             Dictionary with database metadata
         """
+        self._load_all_software()
         return {
             "metadata": self.metadata,
             "total_vulnerabilities": sum(len(vulns) for vulns in self.vulnerabilities.values()),
@@ -282,7 +530,40 @@ class CVEDatabase:
             List of all vulnerabilities for the software
         """
         normalized_name = self._normalize_software_name(software_name)
-        return self.vulnerabilities.get(normalized_name, [])
+        return self._software_vulnerabilities(normalized_name)
+    
+    def get_vulnerability(self, cve_id: str) -> Optional[Tuple[str, Vulnerability]]:
+        """
+        Look up a single vulnerability by its exact CVE ID.
+        
+        Args:
+            cve_id: CVE identifier (case-insensitive, e.g. "CVE-2021-39137")
+            
+        Returns:
+            Tuple (software_name, vulnerability), or None if the ID is unknown
+        """
+        cve_id = cve_id.strip().upper()
+        
+        if self._connection is not None:
+            # Use the cve_id index instead of loading every software
+            with self._connection_lock:
+                row = self._connection.execute(
+                    "SELECT software FROM vulns WHERE cve_id = ? LIMIT 1", (cve_id,)
+                ).fetchone()
+            if row is None:
+                return None
+            for vuln in self._software_vulnerabilities(row[0]):
+                if vuln.cve_id.upper() == cve_id:
+                    return row[0], vuln
+            return None
+        
+        if self._by_cve is None:
+            self._by_cve = {
+                vuln.cve_id.upper(): (software_name, vuln)
+                for software_name, vulns in self.vulnerabilities.items()
+                for vuln in vulns
+            }
+        return self._by_cve.get(cve_id)
     
     def search_vulnerabilities(self, search_term: str) -> List[Tuple[str, Vulnerability]]:
         """
@@ -294,17 +575,24 @@ class CVEDatabase:
         Returns:
             List of tuples (software_name, vulnerability) matching the search term
         """
-        results = []
-        search_lower = search_term.lower()
+        if self._search_entries is None:
+            # Lowercase the searchable text once instead of on every query
+            self._load_all_software()
+            self._search_entries = [
+                ("\0".join((vuln.cve_id, vuln.title, vuln.description)).lower(), software_name, vuln)
+                for software_name, vulns in self.vulnerabilities.items()
+                for vuln in vulns
+            ]
         
-        for software_name, vulns in self.vulnerabilities.items():
-            for vuln in vulns:
-                if (search_lower in vuln.cve_id.lower() or
-                    search_lower in vuln.title.lower() or
-                    search_lower in vuln.description.lower()):
-                    results.append((software_name, vuln))
+        search_lower = search_term.lower()
+        if "\0" in search_lower:
+            return []
         
-        return results
+        return [
+            (software_name, vuln)
+            for haystack, software_name, vuln in self._search_entries
+            if search_lower in haystack
+        ]
 
 
 # Convenience function for quick vulnerability checks
@@ -325,7 +613,62 @@ def check_software_vulnerabilities(software_name: str, software_version: str,
     return cve_db.check_vulnerabilities(software_name, software_version)
 
 
-if __name__ == "__main__":
+def import_json(json_path: str, db_path: str) -> int:
+    """
+    Convert a JSON CVE database into the indexed SQLite form.
+    
+    Args:
+        json_path: Path to the source JSON database
+        db_path: Path of the SQLite file to create (replaced if it exists)
+        
+    Returns:
+        Number of vulnerabilities written
+    """
+    with open(json_path, 'rb') as f:
+        data = _json_loads(f.read())
+    
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    
+    rows = []
+    for software, vulns in data.get('vulnerabilities', {}).items():
+        for vuln_data in vulns:
+            affected = vuln_data.get('affected_versions', {})
+            rows.append((
+                CVEDatabase._normalize_software_name(software),
+                vuln_data.get('cve_id'),
+                vuln_data.get('severity'),
+                vuln_data.get('cvss_score'),
+                affected.get('min'),
+                affected.get('max'),
+                vuln_data.get('fixed_in'),
+                json.dumps(vuln_data)
+            ))
+    
+    connection = sqlite3.connect(db_path)
+    try:
+        with connection:
+            connection.executescript(_SQLITE_SCHEMA)
+            connection.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [('metadata', json.dumps(data.get('metadata', {}))),
+                 ('severity_mapping', json.dumps(data.get('severity_mapping', {})))]
+            )
+            connection.executemany("INSERT INTO vulns VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    finally:
+        connection.close()
+    
+    return len(rows)
+
+
+if __name__ == "__main__" and sys.argv[1:2] == ['import-json']:
+    # Build the SQLite database: python cve_database.py import-json src.json out.db
+    if len(sys.argv) != 4:
+        sys.exit("Usage: python cve_database.py import-json <src.json> <out.db>")
+    count = import_json(sys.argv[2], sys.argv[3])
+    print(f"Imported {count} vulnerabilities into {sys.argv[3]}")
+    
+elif __name__ == "__main__":
     # Example usage and testing
     print("🔍 CVE Database Manager - Testing")
     print("=" * 50)
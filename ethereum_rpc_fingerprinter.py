@@ -6,15 +6,25 @@ This module provides comprehensive fingerprinting capabilities for Ethereum RPC
 helping identify node implementations, versions, networks, and other characteristics.
 """
 
+import copy
+import functools
+import itertools
 import json
+import math
+import re
 import time
 import asyncio
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 import click
+import socket
 import sys
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass, asdict, field
 from tqdm.asyncio import tqdm as atqdm
 from tqdm import tqdm
 from web3 import Web3
@@ -30,13 +40,550 @@ from rich.live import Live
 from rich import box
 from cve_database import CVEDatabase, Vulnerability
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    
+    def _json_dumps_pretty(data: Any) -> bytes:
+        """Serialize data as indented JSON bytes"""
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize data as compact JSON bytes"""
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+    
+    def _json_dumps_pretty(data: Any) -> bytes:
+        """Serialize data as indented JSON bytes"""
+        return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick is an optional speedup
+    ahocorasick = None
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # Initialize colorama for cross-platform colored output
 init()
 
 # Initialize Rich console
 console = Console()
 
-@dataclass
+# Sentinel returned when a JSON-RPC response carries no 'result' member
+_MISSING = object()
+
+# Fast paths that slice the 'result' member straight out of the raw response body
+_STRING_RESULT_RE = re.compile(rb'"result"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+_SCALAR_RESULT_RE = re.compile(rb'"result"\s*:\s*(?:"(0x[0-9a-fA-F]+)"|(\d+)|(true|false))')
+
+# Methods whose result is a short hex/decimal/boolean scalar
+_SCALAR_RESULT_METHODS = frozenset([
+    'net_version', 'eth_chainId', 'eth_blockNumber', 'eth_gasPrice',
+    'net_peerCount', 'eth_hashrate', 'eth_mining', 'eth_syncing',
+])
+
+
+# Client version parsing patterns, compiled once at import
+_JAVA_VERSION_RE = re.compile(r'java-?(\d+(?:\.\d+)*)')
+_ANVIL_VERSION_RE = re.compile(r'anvil\s+(\d+\.\d+\.\d+)', re.IGNORECASE)
+_PAREN_BUILD_RE = re.compile(r'\(([^)]+)\)')
+_GENERIC_VERSION_RE = re.compile(r'v?(\d+\.\d+\.\d+(?:[-+][^\s/]+)?)')
+_IMPL_VERSION_RE = re.compile(r'v?(\d+\.\d+\.\d+(?:[.-]\w+)*)')
+_GO_VERSION_RE = re.compile(r'go(\d+\.\d+(?:\.\d+)?)')
+_JAVA_MAJOR_RE = re.compile(r'java[-]?(\d+)')
+_DOTNET_VERSION_RE = re.compile(r'dotnet(\d+\.\d+(?:\.\d+)?)')
+_RUST_VERSION_RE = re.compile(r'rust[-]?(\d+\.\d+(?:\.\d+)?)')
+_COMMIT_PREFIX_RE = re.compile(r'^[a-f0-9]{7,}')
+_COMMIT_HASH_RE = re.compile(r'^[a-f0-9]{7,}$')
+
+
+def _split_os_arch(os_arch: str, result: Dict[str, Any]) -> None:
+    """Fill operating system and architecture from an 'os-arch' field such as linux-amd64"""
+    if '-' in os_arch:
+        os_part, arch_part = os_arch.split('-', 1)
+        result['operating_system'] = os_part.title()
+        result['architecture'] = arch_part
+
+
+def _parse_geth(version_str: str, result: Dict[str, Any]) -> None:
+    """Geth format: Geth/v1.10.26-stable/linux-amd64/go1.18.5"""
+    parts = version_str.split('/')
+    if len(parts) >= 4:
+        result['node_version'] = parts[1].replace('v', '')
+        result['programming_language'] = 'Go'
+        _split_os_arch(parts[2], result)
+        
+        # Parse Go version
+        go_version = parts[3]
+        if go_version.startswith('go'):
+            result['language_version'] = go_version[2:]
+
+
+def _parse_parity(version_str: str, result: Dict[str, Any]) -> None:
+    """Parity format: Parity-Ethereum/v2.7.2-stable/x86_64-linux-gnu/rustc1.41.0"""
+    parts = version_str.split('/')
+    if len(parts) >= 4:
+        result['node_version'] = parts[1].replace('v', '')
+        result['programming_language'] = 'Rust'
+        
+        # Parse architecture and OS
+        arch_os = parts[2]
+        if 'linux' in arch_os:
+            result['operating_system'] = 'Linux'
+            if arch_os.startswith('x86_64'):
+                result['architecture'] = 'x86_64'
+            elif arch_os.startswith('aarch64'):
+                result['architecture'] = 'aarch64'
+        elif 'darwin' in arch_os or 'macos' in arch_os:
+            result['operating_system'] = 'macOS'
+        elif 'windows' in arch_os:
+            result['operating_system'] = 'Windows'
+        
+        # Parse Rust version
+        rust_version = parts[3]
+        if rust_version.startswith('rustc'):
+            result['language_version'] = rust_version[5:]
+
+
+def _parse_besu(version_str: str, result: Dict[str, Any]) -> None:
+    """Besu format: Besu/v22.10.3/linux-x86_64/openjdk-java-11"""
+    parts = version_str.split('/')
+    if len(parts) >= 4:
+        result['node_version'] = parts[1].replace('v', '')
+        result['programming_language'] = 'Java'
+        _split_os_arch(parts[2], result)
+        
+        # Parse Java version
+        java_info = parts[3]
+        if 'java' in java_info:
+            java_match = _JAVA_VERSION_RE.search(java_info)
+            if java_match:
+                result['language_version'] = java_match.group(1)
+
+
+def _parse_nethermind(version_str: str, result: Dict[str, Any]) -> None:
+    """Nethermind format: Nethermind/v1.14.6+6c21356f/linux-x64/dotnet6.0.11"""
+    parts = version_str.split('/')
+    if len(parts) >= 4:
+        result['node_version'] = parts[1].replace('v', '').split('+')[0]  # Remove commit hash
+        result['programming_language'] = '.NET'
+        _split_os_arch(parts[2], result)
+        
+        # Parse .NET version
+        dotnet_version = parts[3]
+        if dotnet_version.startswith('dotnet'):
+            result['language_version'] = dotnet_version[6:]
+
+
+def _parse_erigon(version_str: str, result: Dict[str, Any]) -> None:
+    """Erigon format: erigon/2.48.1/linux-amd64/go1.19.2"""
+    parts = version_str.split('/')
+    if len(parts) >= 4:
+        result['node_version'] = parts[1]
+        result['programming_language'] = 'Go'
+        _split_os_arch(parts[2], result)
+        
+        # Parse Go version
+        go_version = parts[3]
+        if go_version.startswith('go'):
+            result['language_version'] = go_version[2:]
+
+
+def _parse_anvil(version_str: str, result: Dict[str, Any]) -> None:
+    """Anvil format: anvil 0.1.0 (fdd321b 2023-10-04T00:21:13.119600000Z)"""
+    version_match = _ANVIL_VERSION_RE.search(version_str)
+    if version_match:
+        result['node_version'] = version_match.group(1)
+    
+    result['programming_language'] = 'Rust'
+    
+    # Extract build info
+    build_match = _PAREN_BUILD_RE.search(version_str)
+    if build_match:
+        result['build_info']['commit_timestamp'] = build_match.group(1)
+
+
+def _parse_hardhat(version_str: str, result: Dict[str, Any]) -> None:
+    """Hardhat Network format: varies significantly"""
+    result['programming_language'] = 'JavaScript/TypeScript'
+    result['operating_system'] = 'Node.js'
+
+
+def _parse_ganache(version_str: str, result: Dict[str, Any]) -> None:
+    """Ganache format: varies"""
+    result['programming_language'] = 'JavaScript'
+    result['operating_system'] = 'Node.js'
+
+
+# Client-specific parsers keyed on the lowercased name before the first '/' or space
+_PARSERS: Dict[str, Callable[[str, Dict[str, Any]], None]] = {
+    'geth': _parse_geth,
+    'turbogeth': _parse_geth,
+    'parity': _parse_parity,
+    'parity-ethereum': _parse_parity,
+    'openethereum': _parse_parity,
+    'besu': _parse_besu,
+    'nethermind': _parse_nethermind,
+    'erigon': _parse_erigon,
+    'anvil': _parse_anvil,
+    'hardhat': _parse_hardhat,
+    'hardhatnetwork': _parse_hardhat,
+    'ganache': _parse_ganache,
+}
+
+# Ordered keyword fallback for client strings whose prefix is not a known client name
+_PARSER_KEYWORDS: Tuple[Tuple[str, Callable[[str, Dict[str, Any]], None]], ...] = (
+    ('turbogeth', _parse_geth),
+    ('parity', _parse_parity),
+    ('openethereum', _parse_parity),
+    ('besu', _parse_besu),
+    ('nethermind', _parse_nethermind),
+    ('erigon', _parse_erigon),
+    ('anvil', _parse_anvil),
+    ('hardhat', _parse_hardhat),
+    ('ganache', _parse_ganache),
+)
+
+
+# Implementation keywords in detection priority order: when a client string
+# contains several of them, the earliest entry wins
+_IMPLEMENTATION_KEYWORDS: Tuple[Tuple[str, str], ...] = (
+    ('geth', 'Geth'),
+    ('turbogeth', 'Geth'),
+    ('parity', 'Parity/OpenEthereum'),
+    ('openethereum', 'Parity/OpenEthereum'),
+    ('besu', 'Besu'),
+    ('nethermind', 'Nethermind'),
+    ('erigon', 'Erigon'),
+    ('reth', 'Reth'),
+    ('hardhat', 'Hardhat'),
+    ('ethereumjs', 'EthereumJS'),
+    ('anvil', 'Anvil'),
+    ('ganache', 'Ganache'),
+    ('testrpc', 'Ganache'),
+)
+# The lookahead reports every (possibly overlapping) keyword occurrence in one scan
+_IMPLEMENTATION_RE = re.compile('(?=(' + '|'.join(keyword for keyword, _ in _IMPLEMENTATION_KEYWORDS) + '))')
+_IMPLEMENTATION_NAMES = dict(_IMPLEMENTATION_KEYWORDS)
+_IMPLEMENTATION_PRIORITY = {keyword: rank for rank, (keyword, _) in enumerate(_IMPLEMENTATION_KEYWORDS)}
+
+
+def _build_implementation_automaton() -> Any:
+    """Build an Aho-Corasick automaton yielding (rank, implementation) for each keyword"""
+    automaton = ahocorasick.Automaton()
+    for rank, (keyword, name) in enumerate(_IMPLEMENTATION_KEYWORDS):
+        automaton.add_word(keyword, (rank, name))
+    automaton.make_automaton()
+    return automaton
+
+
+# C automaton matching all keywords in one pass, used instead of the regex when installed
+_IMPLEMENTATION_AUTOMATON = _build_implementation_automaton() if ahocorasick is not None else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_node_implementation(client_version: Optional[str]) -> Optional[str]:
+    """Map a client version string to its node implementation name"""
+    if not client_version or not client_version.strip():
+        return None
+    
+    if _IMPLEMENTATION_AUTOMATON is not None:
+        best = min((match for _, match in _IMPLEMENTATION_AUTOMATON.iter(client_version.lower())), default=None)
+        return best[1] if best is not None else 'Unknown'
+    
+    keywords = _IMPLEMENTATION_RE.findall(client_version.lower())
+    if not keywords:
+        return 'Unknown'
+    return _IMPLEMENTATION_NAMES[min(keywords, key=_IMPLEMENTATION_PRIORITY.__getitem__)]
+
+
+def _copy_client_details(details: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached client version parse so callers can modify it freely"""
+    details = dict(details)
+    if 'build_info' in details:
+        details['build_info'] = dict(details['build_info'])
+    return details
+
+
+# Above this many endpoints the progress bar redraws less often
+_LARGE_SCAN_THRESHOLD = 500
+
+
+def _progress_refresh_rate(total: int) -> int:
+    """Progress bar refreshes per second, throttled for very large scans"""
+    return 2 if total > _LARGE_SCAN_THRESHOLD else 10
+
+
+def _hex_to_int(value: Any) -> Any:
+    """Convert a hex ('0x1a') or decimal ('26') string result to int, leaving other values untouched"""
+    if isinstance(value, str):
+        if value.startswith('0x'):
+            return int(value, 16)
+        if value.isdigit():
+            return int(value)
+    return value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Per-method conversion of raw JSON-RPC results
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'net_version': _hex_to_int,
+    'eth_chainId': _hex_to_int,
+    'eth_blockNumber': _hex_to_int,
+    'eth_gasPrice': _hex_to_int,
+    'net_peerCount': _hex_to_int,
+    'eth_hashrate': _hex_to_int,
+}
+
+
+def _checksum_accounts(accounts: Any) -> Any:
+    """Checksum every address of an eth_accounts result, as Web3 does"""
+    if isinstance(accounts, list):
+        return [Web3.to_checksum_address(account) for account in accounts]
+    return accounts
+
+
+# Basic node information the sync fingerprinter fetches in a single JSON-RPC batch:
+# (method, result attribute, label used in error messages)
+_BASIC_INFO_PROBES: Tuple[Tuple[str, str, str], ...] = (
+    ("web3_clientVersion", "client_version", "client version"),
+    ("net_version", "network_id", "network ID"),
+    ("eth_chainId", "chain_id", "chain ID"),
+    ("eth_blockNumber", "block_number", "block number"),
+    ("eth_gasPrice", "gas_price", "gas price"),
+    ("net_peerCount", "peer_count", "peer count"),
+    ("eth_syncing", "syncing", "syncing status"),
+    ("eth_mining", "mining", "mining status"),
+    ("eth_hashrate", "hashrate", "hashrate"),
+    ("eth_accounts", "accounts", "accounts"),
+    ("eth_protocolVersion", "protocol_version", "protocol version"),
+)
+
+# Conversion of batched results to the types the Web3 accessors return
+_BATCH_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'eth_chainId': _hex_to_int,
+    'eth_blockNumber': _hex_to_int,
+    'eth_gasPrice': _hex_to_int,
+    'net_peerCount': _hex_to_int,
+    'eth_hashrate': _hex_to_int,
+    'eth_syncing': bool,
+    'eth_accounts': _checksum_accounts,
+}
+
+# Seconds a successful parameterless probe answer is reused for the same endpoint;
+# identity answers never change while a node runs, the head block moves every few seconds
+_PROBE_CACHE_POLICY: Dict[str, float] = {
+    'web3_clientVersion': math.inf,
+    'net_version': math.inf,
+    'eth_chainId': math.inf,
+    'eth_blockNumber': 1.0,
+}
+# Most (endpoint, method) answers kept; the oldest entries are evicted first
+_PROBE_CACHE_SIZE = 4096
+# Most endpoint results kept with cache_ttl; the oldest entries are evicted first
+_RESULT_CACHE_SIZE = 1024
+
+# Upper bound in seconds on establishing a connection, so unreachable hosts fail fast
+# even when the read timeout is generous
+_CONNECT_TIMEOUT = 2.0
+
+
+# JSON-RPC methods probed by the async gatherer, with the result attribute each one fills
+_METHODS_TO_TEST: Tuple[Tuple[str, str], ...] = (
+    ("net_version", "network_id"),
+    ("eth_chainId", "chain_id"),
+    ("eth_blockNumber", "block_number"),
+    ("eth_gasPrice", "gas_price"),
+    ("net_peerCount", "peer_count"),
+    ("eth_syncing", "syncing"),
+    ("eth_mining", "mining"),
+    ("eth_hashrate", "hashrate"),
+    ("eth_accounts", "accounts"),
+    ("eth_protocolVersion", "protocol_version"),
+)
+
+# Pre-serialized request bodies; JSON-RPC ids only need to be unique within one request
+_METHOD_PAYLOADS: Dict[str, bytes] = {
+    method: _json_dumps({"jsonrpc": "2.0", "method": method, "params": [], "id": 1})
+    for method in ("web3_clientVersion",) + tuple(method for method, _ in _METHODS_TO_TEST)
+}
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Basic-info batch sent by the async fingerprinter; each call's id is its index in _BASIC_INFO_PROBES
+_BASIC_INFO_BATCH: bytes = _json_dumps([
+    {"jsonrpc": "2.0", "method": method, "params": [], "id": index}
+    for index, (method, _, _) in enumerate(_BASIC_INFO_PROBES)
+])
+
+# JSON-RPC methods probed by method discovery, in report order
+_STANDARD_METHODS: Tuple[str, ...] = (
+    'web3_clientVersion',
+    'web3_sha3',
+    'net_version',
+    'net_peerCount',
+    'net_listening',
+    'eth_protocolVersion',
+    'eth_syncing',
+    'eth_coinbase',
+    'eth_mining',
+    'eth_hashrate',
+    'eth_gasPrice',
+    'eth_accounts',
+    'eth_blockNumber',
+    'eth_getBalance',
+    'eth_getStorageAt',
+    'eth_getTransactionCount',
+    'eth_getBlockTransactionCountByHash',
+    'eth_getBlockTransactionCountByNumber',
+    'eth_getUncleCountByBlockHash',
+    'eth_getUncleCountByBlockNumber',
+    'eth_getCode',
+    'eth_sign',
+    'eth_sendTransaction',
+    'eth_sendRawTransaction',
+    'eth_call',
+    'eth_estimateGas',
+    'eth_getBlockByHash',
+    'eth_getBlockByNumber',
+    'eth_getTransactionByHash',
+    'eth_getTransactionByBlockHashAndIndex',
+    'eth_getTransactionByBlockNumberAndIndex',
+    'eth_getTransactionReceipt',
+    'eth_getUncleByBlockHashAndIndex',
+    'eth_getUncleByBlockNumberAndIndex',
+    'eth_getCompilers',
+    'eth_compileLLL',
+    'eth_compileSolidity',
+    'eth_compileSerpent',
+    'eth_newFilter',
+    'eth_newBlockFilter',
+    'eth_newPendingTransactionFilter',
+    'eth_uninstallFilter',
+    'eth_getFilterChanges',
+    'eth_getFilterLogs',
+    'eth_getLogs',
+    'eth_getWork',
+    'eth_submitWork',
+    'eth_submitHashrate',
+    'db_putString',
+    'db_getString',
+    'db_putHex',
+    'db_getHex',
+    'shh_post',
+    'shh_version',
+    'shh_newIdentity',
+    'shh_hasIdentity',
+    'shh_newGroup',
+    'shh_addToGroup',
+    'shh_newFilter',
+    'shh_uninstallFilter',
+    'shh_getFilterChanges',
+    'shh_getMessages',
+)
+
+# Discovery batch, serialized once; each call's id is its index in _STANDARD_METHODS
+_DISCOVERY_BATCH: bytes = _json_dumps([
+    {"jsonrpc": "2.0", "method": method, "params": [], "id": index}
+    for index, method in enumerate(_STANDARD_METHODS)
+])
+
+
+def _extract_rpc_result(body: bytes, method: str) -> Any:
+    """
+    Extract the 'result' member from a raw JSON-RPC response body.
+
+    String results of web3_clientVersion and scalar results of the numeric
+    methods are matched directly on the bytes; anything else (escaped strings,
+    objects, lists, odd servers) falls back to a full JSON parse.
+
+    Returns _MISSING if the response has no 'result' member.
+    """
+    if method == 'web3_clientVersion':
+        match = _STRING_RESULT_RE.search(body)
+        if match and b'\\' not in match.group(1):
+            return match.group(1).decode('utf-8', 'surrogatepass')
+    elif method in _SCALAR_RESULT_METHODS:
+        match = _SCALAR_RESULT_RE.search(body)
+        if match:
+            hex_value, int_value, bool_value = match.groups()
+            if hex_value is not None:
+                return hex_value.decode('ascii')
+            if int_value is not None:
+                return int(int_value)
+            return bool_value == b'true'
+    
+    data = _json_loads(body)
+    if isinstance(data, dict) and 'result' in data:
+        return data['result']
+    return _MISSING
+
+
+def _method_supported(response: Any) -> bool:
+    """A method is supported unless the node answers with "method not found" (-32601)"""
+    try:
+        return 'error' not in response or response['error']['code'] != -32601
+    except Exception:
+        return False
+
+
+# Most error messages kept per result; older ones are dropped first
+_MAX_ERRORS = 1024
+
+
+class _ErrorList(list):
+    """List of error messages that keeps only the newest _MAX_ERRORS entries, however they are added"""
+    __slots__ = ()
+    
+    def __init__(self, messages: Iterable[str] = ()) -> None:
+        super().__init__(messages)
+        self._trim()
+    
+    def _trim(self) -> None:
+        excess = len(self) - _MAX_ERRORS
+        if excess > 0:
+            del self[:excess]
+    
+    def append(self, message: str) -> None:
+        super().append(message)
+        if len(self) > _MAX_ERRORS:
+            del self[0]
+    
+    def extend(self, messages: Iterable[str]) -> None:
+        super().extend(messages)
+        self._trim()
+    
+    def insert(self, index: int, message: str) -> None:
+        super().insert(index, message)
+        self._trim()
+    
+    def __setitem__(self, index, value) -> None:
+        # Slice assignment can grow the list
+        super().__setitem__(index, value)
+        self._trim()
+    
+    def __iadd__(self, messages: Iterable[str]) -> "_ErrorList":
+        self.extend(messages)
+        return self
+    
+    def __imul__(self, count: int) -> "_ErrorList":
+        super().__imul__(count)
+        self._trim()
+        return self
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class FingerprintResult:
     """Data class to store fingerprinting results"""
     endpoint: str
@@ -60,114 +607,173 @@ class FingerprintResult:
     protocol_version: Optional[str] = None
     supported_methods: Optional[List[str]] = None
     response_time: Optional[float] = None
-    errors: Optional[List[str]] = None
+    errors: List[str] = field(default_factory=_ErrorList)
     additional_info: Optional[Dict[str, Any]] = None
     vulnerabilities: Optional[List[Vulnerability]] = None
     security_risk_level: Optional[str] = None
+    
+    def __post_init__(self):
+        # Bound caller-provided error lists too, so a misbehaving endpoint cannot grow them without limit
+        if type(self.errors) is not _ErrorList:
+            self.errors = _ErrorList(self.errors or ())
+
+
+def _create_session() -> requests.Session:
+    """Create a requests session pooling keep-alive connections for every probe of an endpoint"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _apply_client_version(result: FingerprintResult,
+                          parse_client_version: Callable[[str], Dict[str, Any]]) -> None:
+    """Derive implementation and build details from result.client_version"""
+    result.node_implementation = _detect_node_implementation(result.client_version)
+    
+    # Parse detailed client information
+    client_details = parse_client_version(result.client_version)
+    result.node_version = client_details.get('node_version')
+    result.programming_language = client_details.get('programming_language')
+    result.language_version = client_details.get('language_version')
+    result.operating_system = client_details.get('operating_system')
+    result.architecture = client_details.get('architecture')
+    result.build_info = client_details.get('build_info')
+
+
+def _apply_batch_info(result: FingerprintResult, responses: Dict[str, Dict[str, Any]],
+                      parse_client_version: Callable[[str], Dict[str, Any]],
+                      converters: Dict[str, Callable[[Any], Any]], report_rpc_errors: bool) -> None:
+    """
+    Fill basic node information from batched JSON-RPC responses
+    
+    The result matches the fingerprinter's own one-request-per-method path:
+    with report_rpc_errors (sync) missing and error answers are reported under
+    the probe's label, as the Web3 accessors raise on them; without it (async)
+    they are skipped, and only conversion failures are reported, by method.
+    """
+    get_converter = converters.get
+    
+    for method, attr_name, label in _BASIC_INFO_PROBES:
+        response = responses.get(method)
+        if not report_rpc_errors:
+            if response is not None and 'result' in response and 'error' not in response:
+                try:
+                    setattr(result, attr_name, get_converter(method, _identity)(response['result']))
+                except Exception as e:
+                    result.errors.append(f"Failed to get {method}: {e}")
+        elif response is None:
+            result.errors.append(f"Failed to get {label}: no response in batch")
+        elif 'error' in response:
+            error = response['error']
+            message = error.get('message', error) if isinstance(error, dict) else error
+            result.errors.append(f"Failed to get {label}: {message}")
+        else:
+            try:
+                setattr(result, attr_name, get_converter(method, _identity)(response.get('result')))
+            except Exception as e:
+                result.errors.append(f"Failed to get {label}: {e}")
+    
+    if result.client_version is not None:
+        _apply_client_version(result, parse_client_version)
+
 
 class EthereumRPCFingerprinter:
     """
     Comprehensive Ethereum RPC fingerprinting tool
     """
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, cve_database: Optional[CVEDatabase] = None,
+                 defer_cve: bool = False, session: Optional[requests.Session] = None,
+                 cache_ttl: Optional[float] = None):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.timeout = timeout
+        # Seconds a successful result is reused for repeat fingerprints of the same endpoint
+        self.cache_ttl = cache_ttl
+        self._result_cache: Dict[str, Tuple[FingerprintResult, float]] = {}
+        # Reusable probe answers by (endpoint, method), see _PROBE_CACHE_POLICY
+        self._probe_cache: Dict[Tuple[str, str], Tuple[Dict[str, Any], float]] = {}
+        # A caller-provided session keeps its warm connection pools across fingerprinters
+        self.session = session if session is not None else _create_session()
         
-        # Initialize CVE database
+        # Initialize CVE database, reusing an already loaded one when given;
+        # with defer_cve it is loaded by the cve_database property on first use
+        if cve_database is not None:
+            self.cve_database = cve_database
+        elif not defer_cve:
+            self.cve_database = self._load_cve_database()
+    
+    @functools.cached_property
+    def cve_database(self) -> Optional[CVEDatabase]:
+        """CVE database, loaded on first access when construction deferred it"""
+        return self._load_cve_database()
+    
+    @staticmethod
+    def _load_cve_database() -> Optional[CVEDatabase]:
+        """Load the bundled CVE database, or return None if it cannot be loaded"""
         try:
-            self.cve_database = CVEDatabase()
+            return CVEDatabase()
         except Exception as e:
             print(f"Warning: Could not load CVE database: {e}")
-            self.cve_database = None
+            return None
         
     def fingerprint(self, endpoint: str) -> FingerprintResult:
         """
         Perform comprehensive fingerprinting of an Ethereum RPC endpoint
+        
+        With cache_ttl set, a result that reached the node is reused for
+        repeat calls on the same endpoint until it expires.
         """
+        if self.cache_ttl:
+            cached = self._result_cache.get(endpoint)
+            if cached is not None:
+                if cached[1] > time.monotonic():
+                    return copy.deepcopy(cached[0])
+                del self._result_cache[endpoint]
+        
+        result = self._fingerprint_endpoint(endpoint)
+        
+        # Only cache results that got an answer; connection failures may be transient
+        if self.cache_ttl and result.client_version is not None:
+            if endpoint not in self._result_cache and len(self._result_cache) >= _RESULT_CACHE_SIZE:
+                self._result_cache.pop(next(iter(self._result_cache)), None)
+            self._result_cache[endpoint] = (copy.deepcopy(result), time.monotonic() + self.cache_ttl)
+        return result
+    
+    @property
+    def _request_timeout(self) -> Tuple[float, float]:
+        """(connect, read) timeout passed to requests"""
+        return (min(self.timeout, _CONNECT_TIMEOUT), self.timeout)
+    
+    def _fingerprint_endpoint(self, endpoint: str) -> FingerprintResult:
+        """Probe an endpoint, bypassing the result cache"""
         result = FingerprintResult(endpoint=endpoint, errors=[])
         start_time = time.time()
         
         try:
             # Try to connect with Web3
-            w3 = Web3(Web3.HTTPProvider(endpoint, request_kwargs={'timeout': self.timeout}))
+            # Share the fingerprinter's session so Web3 calls reuse its pooled keep-alive connections
+            w3 = Web3(Web3.HTTPProvider(endpoint, request_kwargs={'timeout': self._request_timeout}, session=self.session))
             
-            # Test basic connectivity
-            if not w3.is_connected():
+            # Test basic connectivity; the single liveness request is the only one an unreachable host costs
+            try:
+                connected = w3.is_connected(show_traceback=True)
+            except Exception as e:
+                result.errors.append(f"Unable to connect to endpoint: {e}")
+                return result
+            if not connected:
                 result.errors.append("Unable to connect to endpoint")
                 return result
                 
             result.response_time = time.time() - start_time
             
-            # Basic network information
-            try:
-                result.client_version = w3.client_version
-                result.node_implementation = self._extract_node_implementation(result.client_version)
-                
-                # Parse detailed client information
-                client_details = self._parse_client_version(result.client_version)
-                result.node_version = client_details.get('node_version')
-                result.programming_language = client_details.get('programming_language')
-                result.language_version = client_details.get('language_version')
-                result.operating_system = client_details.get('operating_system')
-                result.architecture = client_details.get('architecture')
-                result.build_info = client_details.get('build_info')
-                
-            except Exception as e:
-                result.errors.append(f"Failed to get client version: {e}")
-            
-            try:
-                result.network_id = w3.net.version
-            except Exception as e:
-                result.errors.append(f"Failed to get network ID: {e}")
-                
-            try:
-                result.chain_id = w3.eth.chain_id
-            except Exception as e:
-                result.errors.append(f"Failed to get chain ID: {e}")
-            
-            try:
-                result.block_number = w3.eth.block_number
-            except Exception as e:
-                result.errors.append(f"Failed to get block number: {e}")
-            
-            try:
-                result.gas_price = w3.eth.gas_price
-            except Exception as e:
-                result.errors.append(f"Failed to get gas price: {e}")
-            
-            # Network status
-            try:
-                result.peer_count = w3.net.peer_count
-            except Exception as e:
-                result.errors.append(f"Failed to get peer count: {e}")
-            
-            try:
-                syncing_status = w3.eth.syncing
-                result.syncing = bool(syncing_status)
-            except Exception as e:
-                result.errors.append(f"Failed to get syncing status: {e}")
-            
-            try:
-                result.mining = w3.eth.mining
-            except Exception as e:
-                result.errors.append(f"Failed to get mining status: {e}")
-            
-            try:
-                result.hashrate = w3.eth.hashrate
-            except Exception as e:
-                result.errors.append(f"Failed to get hashrate: {e}")
-            
-            try:
-                result.accounts = w3.eth.accounts
-            except Exception as e:
-                result.errors.append(f"Failed to get accounts: {e}")
-            
-            try:
-                result.protocol_version = w3.eth.protocol_version
-            except Exception as e:
-                result.errors.append(f"Failed to get protocol version: {e}")
+            # Basic network information, in one round trip when the node accepts batches
+            responses = self._batch_rpc(endpoint, [(method, []) for method, _, _ in _BASIC_INFO_PROBES])
+            if responses is not None:
+                _apply_batch_info(result, responses, self._parse_client_version,
+                                  converters=_BATCH_CONVERTERS, report_rpc_errors=True)
+            else:
+                self._gather_basic_info(w3, result)
             
             # Method discovery
             result.supported_methods = self._discover_methods(endpoint)
@@ -183,37 +789,128 @@ class EthereumRPCFingerprinter:
             
         return result
     
-    def _extract_node_implementation(self, client_version: str) -> Optional[str]:
-        """Extract node implementation from client version string"""
-        if not client_version or not client_version.strip():
+    def _batch_rpc(self, endpoint: str, calls: List[Tuple[str, List[Any]]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Send several JSON-RPC calls as one batch request
+        
+        Returns a dict mapping each method to its response object (holding either
+        'result' or 'error'), or None when the endpoint does not answer the batch
+        with a JSON array, in which case callers fall back to individual calls.
+        
+        Answers still fresh in the probe cache are served without asking the node;
+        when every call is cached no request is sent at all.
+        """
+        now = time.monotonic()
+        responses = {}
+        pending = []
+        for method, params in calls:
+            cached = None if params else self._probe_cache.get((endpoint, method))
+            if cached is not None and cached[1] > now:
+                responses[method] = cached[0]
+            else:
+                pending.append((method, params))
+        
+        if not pending:
+            return responses
+        
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": index}
+            for index, (method, params) in enumerate(pending)
+        ]
+        
+        try:
+            response = self.session.post(endpoint, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=self._request_timeout)
+            data = _json_loads(response.content)
+        except Exception:
             return None
+        
+        if not isinstance(data, list):
+            return None
+        
+        # Responses may come back in any order; match them to calls by id
+        for item in data:
+            if isinstance(item, dict) and isinstance(item.get('id'), int) and 0 <= item['id'] < len(pending):
+                method, params = pending[item['id']]
+                responses[method] = item
+                
+                ttl = _PROBE_CACHE_POLICY.get(method)
+                if ttl and not params and 'result' in item:
+                    if len(self._probe_cache) >= _PROBE_CACHE_SIZE:
+                        self._probe_cache.pop(next(iter(self._probe_cache)), None)
+                    self._probe_cache[(endpoint, method)] = (item, now + ttl)
+        return responses
+    
+    def _gather_basic_info(self, w3: Web3, result: FingerprintResult) -> None:
+        """Fill basic node information with one request per field, for nodes without batch support"""
+        try:
+            result.client_version = w3.client_version
+            _apply_client_version(result, self._parse_client_version)
+        except Exception as e:
+            result.errors.append(f"Failed to get client version: {e}")
+        
+        try:
+            result.network_id = w3.net.version
+        except Exception as e:
+            result.errors.append(f"Failed to get network ID: {e}")
             
-        client_lower = client_version.lower()
-        
-        if 'geth' in client_lower or 'turbogeth' in client_lower:
-            return 'Geth'
-        elif 'parity' in client_lower or 'openethereum' in client_lower:
-            return 'Parity/OpenEthereum'
-        elif 'besu' in client_lower:
-            return 'Besu'
-        elif 'nethermind' in client_lower:
-            return 'Nethermind'
-        elif 'erigon' in client_lower:
-            return 'Erigon'
-        elif 'reth' in client_lower:
-            return 'Reth'
-        elif 'hardhat' in client_lower:
-            return 'Hardhat'
-        elif 'ethereumjs' in client_lower:
-            return 'EthereumJS'
-        elif 'anvil' in client_lower:
-            return 'Anvil'
-        elif 'ganache' in client_lower or 'testrpc' in client_lower:
-            return 'Ganache'
-        else:
-            return 'Unknown'
+        try:
+            result.chain_id = w3.eth.chain_id
+        except Exception as e:
+            result.errors.append(f"Failed to get chain ID: {e}")
+        
+        try:
+            result.block_number = w3.eth.block_number
+        except Exception as e:
+            result.errors.append(f"Failed to get block number: {e}")
+        
+        try:
+            result.gas_price = w3.eth.gas_price
+        except Exception as e:
+            result.errors.append(f"Failed to get gas price: {e}")
+        
+        # Network status
+        try:
+            result.peer_count = w3.net.peer_count
+        except Exception as e:
+            result.errors.append(f"Failed to get peer count: {e}")
+        
+        try:
+            syncing_status = w3.eth.syncing
+            result.syncing = bool(syncing_status)
+        except Exception as e:
+            result.errors.append(f"Failed to get syncing status: {e}")
+        
+        try:
+            result.mining = w3.eth.mining
+        except Exception as e:
+            result.errors.append(f"Failed to get mining status: {e}")
+        
+        try:
+            result.hashrate = w3.eth.hashrate
+        except Exception as e:
+            result.errors.append(f"Failed to get hashrate: {e}")
+        
+        try:
+            result.accounts = w3.eth.accounts
+        except Exception as e:
+            result.errors.append(f"Failed to get accounts: {e}")
+        
+        try:
+            result.protocol_version = w3.eth.protocol_version
+        except Exception as e:
+            result.errors.append(f"Failed to get protocol version: {e}")
+    
+    def _extract_node_implementation(self, client_version: str) -> Optional[str]:
+        """Extract node implementation from client version string"""
+        return _detect_node_implementation(client_version)
     
     def _parse_client_version(self, client_version: str) -> Dict[str, Optional[str]]:
+        """Parse client version string, reusing earlier parses of the same string"""
+        return _copy_client_details(self._parse_client_version_cached(client_version))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_client_version_cached(client_version: str) -> Dict[str, Optional[str]]:
         """
         Parse client version string to extract detailed information
         
@@ -241,142 +938,19 @@ class EthereumRPCFingerprinter:
         version_str = client_version.strip()
         
         try:
-            # Geth format: Geth/v1.10.26-stable/linux-amd64/go1.18.5
-            if version_str.lower().startswith('geth/') or 'turbogeth' in version_str.lower():
-                parts = version_str.split('/')
-                if len(parts) >= 4:
-                    result['node_version'] = parts[1].replace('v', '')
-                    result['programming_language'] = 'Go'
-                    
-                    # Parse OS and architecture
-                    os_arch = parts[2]
-                    if '-' in os_arch:
-                        os_part, arch_part = os_arch.split('-', 1)
-                        result['operating_system'] = os_part.title()
-                        result['architecture'] = arch_part
-                    
-                    # Parse Go version
-                    go_version = parts[3]
-                    if go_version.startswith('go'):
-                        result['language_version'] = go_version[2:]
-                        
-            # Parity format: Parity-Ethereum/v2.7.2-stable/x86_64-linux-gnu/rustc1.41.0
-            elif 'parity' in version_str.lower() or 'openethereum' in version_str.lower():
-                parts = version_str.split('/')
-                if len(parts) >= 4:
-                    result['node_version'] = parts[1].replace('v', '')
-                    result['programming_language'] = 'Rust'
-                    
-                    # Parse architecture and OS
-                    arch_os = parts[2]
-                    if 'linux' in arch_os:
-                        result['operating_system'] = 'Linux'
-                        if arch_os.startswith('x86_64'):
-                            result['architecture'] = 'x86_64'
-                        elif arch_os.startswith('aarch64'):
-                            result['architecture'] = 'aarch64'
-                    elif 'darwin' in arch_os or 'macos' in arch_os:
-                        result['operating_system'] = 'macOS'
-                    elif 'windows' in arch_os:
-                        result['operating_system'] = 'Windows'
-                    
-                    # Parse Rust version
-                    rust_version = parts[3]
-                    if rust_version.startswith('rustc'):
-                        result['language_version'] = rust_version[5:]
-                        
-            # Besu format: Besu/v22.10.3/linux-x86_64/openjdk-java-11
-            elif 'besu' in version_str.lower():
-                parts = version_str.split('/')
-                if len(parts) >= 4:
-                    result['node_version'] = parts[1].replace('v', '')
-                    result['programming_language'] = 'Java'
-                    
-                    # Parse OS and architecture
-                    os_arch = parts[2]
-                    if '-' in os_arch:
-                        os_part, arch_part = os_arch.split('-', 1)
-                        result['operating_system'] = os_part.title()
-                        result['architecture'] = arch_part
-                    
-                    # Parse Java version
-                    java_info = parts[3]
-                    if 'java' in java_info:
-                        # Extract version number
-                        import re
-                        java_match = re.search(r'java-?(\d+(?:\.\d+)*)', java_info)
-                        if java_match:
-                            result['language_version'] = java_match.group(1)
-                            
-            # Nethermind format: Nethermind/v1.14.6+6c21356f/linux-x64/dotnet6.0.11
-            elif 'nethermind' in version_str.lower():
-                parts = version_str.split('/')
-                if len(parts) >= 4:
-                    result['node_version'] = parts[1].replace('v', '').split('+')[0]  # Remove commit hash
-                    result['programming_language'] = '.NET'
-                    
-                    # Parse OS and architecture
-                    os_arch = parts[2]
-                    if '-' in os_arch:
-                        os_part, arch_part = os_arch.split('-', 1)
-                        result['operating_system'] = os_part.title()
-                        result['architecture'] = arch_part
-                    
-                    # Parse .NET version
-                    dotnet_version = parts[3]
-                    if dotnet_version.startswith('dotnet'):
-                        result['language_version'] = dotnet_version[6:]
-                        
-            # Erigon format: erigon/2.48.1/linux-amd64/go1.19.2
-            elif 'erigon' in version_str.lower():
-                parts = version_str.split('/')
-                if len(parts) >= 4:
-                    result['node_version'] = parts[1]
-                    result['programming_language'] = 'Go'
-                    
-                    # Parse OS and architecture
-                    os_arch = parts[2]
-                    if '-' in os_arch:
-                        os_part, arch_part = os_arch.split('-', 1)
-                        result['operating_system'] = os_part.title()
-                        result['architecture'] = arch_part
-                    
-                    # Parse Go version
-                    go_version = parts[3]
-                    if go_version.startswith('go'):
-                        result['language_version'] = go_version[2:]
-                        
-            # Anvil format: anvil 0.1.0 (fdd321b 2023-10-04T00:21:13.119600000Z)
-            elif 'anvil' in version_str.lower():
-                import re
-                # Extract version
-                version_match = re.search(r'anvil\s+(\d+\.\d+\.\d+)', version_str, re.IGNORECASE)
-                if version_match:
-                    result['node_version'] = version_match.group(1)
-                
-                result['programming_language'] = 'Rust'
-                
-                # Extract build info
-                build_match = re.search(r'\(([^)]+)\)', version_str)
-                if build_match:
-                    build_info = build_match.group(1)
-                    result['build_info']['commit_timestamp'] = build_info
-                    
-            # Hardhat Network format: varies significantly
-            elif 'hardhat' in version_str.lower():
-                result['programming_language'] = 'JavaScript/TypeScript'
-                result['operating_system'] = 'Node.js'
-                
-            # Ganache format: varies
-            elif 'ganache' in version_str.lower():
-                result['programming_language'] = 'JavaScript'
-                result['operating_system'] = 'Node.js'
+            # Dispatch on the client name prefix, falling back to a keyword scan
+            prefix = version_str.split('/', 1)[0].split(' ', 1)[0].lower()
+            parser = _PARSERS.get(prefix)
+            if parser is None:
+                version_lower = version_str.lower()
+                parser = next((fn for keyword, fn in _PARSER_KEYWORDS if keyword in version_lower), None)
+            if parser is not None:
+                parser(version_str, result)
                 
             # Try to extract generic patterns if specific parsing failed
             if not result['node_version']:
-                import re
                 # Look for version patterns like v1.2.3 or 1.2.3
-                version_match = re.search(r'v?(\d+\.\d+\.\d+(?:[-+][^\s/]+)?)', version_str)
+                version_match = _GENERIC_VERSION_RE.search(version_str)
                 if version_match:
                     result['node_version'] = version_match.group(1)
             
@@ -412,97 +986,55 @@ class EthereumRPCFingerprinter:
         
         return result
     
+    def _rpc_post(self, endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+        """POST a JSON-RPC payload through the fingerprinter's session"""
+        return self.session.post(endpoint, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=self._request_timeout)
+    
     def _discover_methods(self, endpoint: str) -> List[str]:
-        """Discover supported RPC methods"""
-        common_methods = [
-            'web3_clientVersion',
-            'web3_sha3',
-            'net_version',
-            'net_peerCount',
-            'net_listening',
-            'eth_protocolVersion',
-            'eth_syncing',
-            'eth_coinbase',
-            'eth_mining',
-            'eth_hashrate',
-            'eth_gasPrice',
-            'eth_accounts',
-            'eth_blockNumber',
-            'eth_getBalance',
-            'eth_getStorageAt',
-            'eth_getTransactionCount',
-            'eth_getBlockTransactionCountByHash',
-            'eth_getBlockTransactionCountByNumber',
-            'eth_getUncleCountByBlockHash',
-            'eth_getUncleCountByBlockNumber',
-            'eth_getCode',
-            'eth_sign',
-            'eth_sendTransaction',
-            'eth_sendRawTransaction',
-            'eth_call',
-            'eth_estimateGas',
-            'eth_getBlockByHash',
-            'eth_getBlockByNumber',
-            'eth_getTransactionByHash',
-            'eth_getTransactionByBlockHashAndIndex',
-            'eth_getTransactionByBlockNumberAndIndex',
-            'eth_getTransactionReceipt',
-            'eth_getUncleByBlockHashAndIndex',
-            'eth_getUncleByBlockNumberAndIndex',
-            'eth_getCompilers',
-            'eth_compileLLL',
-            'eth_compileSolidity',
-            'eth_compileSerpent',
-            'eth_newFilter',
-            'eth_newBlockFilter',
-            'eth_newPendingTransactionFilter',
-            'eth_uninstallFilter',
-            'eth_getFilterChanges',
-            'eth_getFilterLogs',
-            'eth_getLogs',
-            'eth_getWork',
-            'eth_submitWork',
-            'eth_submitHashrate',
-            'db_putString',
-            'db_getString',
-            'db_putHex',
-            'db_getHex',
-            'shh_post',
-            'shh_version',
-            'shh_newIdentity',
-            'shh_hasIdentity',
-            'shh_newGroup',
-            'shh_addToGroup',
-            'shh_newFilter',
-            'shh_uninstallFilter',
-            'shh_getFilterChanges',
-            'shh_getMessages'
-        ]
+        """
+        Discover supported RPC methods
         
-        supported = []
+        All of _STANDARD_METHODS are probed in one batch request; nodes that do
+        not answer batches with a JSON array are probed one method at a time.
+        Only a method's own error answer marks it unsupported: methods whose
+        answer is missing from a truncated or partial batch reply are probed
+        again on their own.
+        """
+        try:
+            response = self.session.post(endpoint, data=_DISCOVERY_BATCH, headers=_JSON_HEADERS, timeout=self._request_timeout)
+        except Exception:
+            return []
         
-        for method in common_methods:
-            try:
-                # Test method with minimal valid parameters
-                payload = {
-                    "jsonrpc": "2.0",
-                    "method": method,
-                    "params": [],
-                    "id": 1
-                }
-                
-                response = self.session.post(endpoint, json=payload)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    # Method is supported if it doesn't return "method not found" error
-                    if 'error' not in data or data['error']['code'] != -32601:
-                        supported.append(method)
-                        
-            except Exception:
-                continue
-                
-        return supported
+        try:
+            data = _json_loads(response.content) if response.status_code == 200 else None
+        except Exception:
+            data = None
+        
+        if not isinstance(data, list):
+            return [method for method in _STANDARD_METHODS if self._probe_method(endpoint, method)]
+        
+        answered = [None] * len(_STANDARD_METHODS)
+        for item in data:
+            if isinstance(item, dict) and isinstance(item.get('id'), int) and 0 <= item['id'] < len(answered):
+                answered[item['id']] = item
+        return [method for method, item in zip(_STANDARD_METHODS, answered)
+                if (_method_supported(item) if item is not None else self._probe_method(endpoint, method))]
+    
+    def _probe_method(self, endpoint: str, method: str) -> bool:
+        """Probe a single method on its own; False when it is unsupported or the request fails"""
+        try:
+            # Test method with minimal valid parameters
+            payload = {
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": [],
+                "id": 1
+            }
+            
+            response = self._rpc_post(endpoint, payload)
+            return response.status_code == 200 and _method_supported(_json_loads(response.content))
+        except Exception:
+            return False
     
     def _advanced_fingerprinting(self, w3: Web3, endpoint: str) -> Dict[str, Any]:
         """Perform advanced fingerprinting techniques"""
@@ -516,9 +1048,9 @@ class EthereumRPCFingerprinter:
                 "params": [],
                 "id": 1
             }
-            response = self.session.post(endpoint, json=admin_payload)
+            response = self._rpc_post(endpoint, admin_payload)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'result' in data:
                     info['admin_namespace'] = True
                     info['node_info'] = data['result']
@@ -534,9 +1066,9 @@ class EthereumRPCFingerprinter:
                 "params": ["0x0", {}],
                 "id": 1
             }
-            response = self.session.post(endpoint, json=debug_payload)
+            response = self._rpc_post(endpoint, debug_payload)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 # Even if it fails, if method exists it will return a different error
                 if 'error' not in data or data['error']['code'] != -32601:
                     info['debug_namespace'] = True
@@ -552,9 +1084,9 @@ class EthereumRPCFingerprinter:
                 "params": [],
                 "id": 1
             }
-            response = self.session.post(endpoint, json=txpool_payload)
+            response = self._rpc_post(endpoint, txpool_payload)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'result' in data:
                     info['txpool_namespace'] = True
                     info['txpool_status'] = data['result']
@@ -602,8 +1134,6 @@ class EthereumRPCFingerprinter:
             result.security_risk_level = self._calculate_risk_level(vulnerabilities)
             
         except Exception as e:
-            if result.errors is None:
-                result.errors = []
             result.errors.append(f"CVE vulnerability check failed: {e}")
         
         return result
@@ -621,117 +1151,177 @@ class EthereumRPCFingerprinter:
         if not vulnerabilities:
             return "NONE"
         
-        # Determine highest severity
-        severity_scores = {"CRITICAL": 4, "HIGH": 3, "MEDIUM": 2, "LOW": 1}
-        max_severity = 0
-        
-        for vuln in vulnerabilities:
-            severity_score = severity_scores.get(vuln.severity, 0)
-            max_severity = max(max_severity, severity_score)
-        
         # Return the highest severity found
-        for severity, score in severity_scores.items():
-            if score == max_severity:
-                return severity
-        
-        return "LOW"
+        return max(vuln.severity_rank for vuln in vulnerabilities).name
 
 class AsyncEthereumRPCFingerprinter:
     """
     Asynchronous version for fingerprinting multiple endpoints
+    
+    The HTTP session and its connector are created on first use and kept
+    for the lifetime of the fingerprinter, so repeated runs reuse cached DNS
+    answers and open connections. Call aclose() or use the fingerprinter as
+    an async context manager to release them.
     """
     
-    def __init__(self, timeout: int = 10, max_concurrent: int = 10):
+    def __init__(self, timeout: int = 10, max_concurrent: int = 10, ipv4_only: bool = False):
         self.timeout = timeout
         self.max_concurrent = max_concurrent
+        self.ipv4_only = ipv4_only
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def __aenter__(self) -> 'AsyncEthereumRPCFingerprinter':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the long-lived HTTP session and its connector"""
+        session = self._session
+        self._session = self._connector = self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the long-lived HTTP session, creating it on first use
+        
+        A session is bound to the event loop it was created on, so a new one
+        is opened when the fingerprinter is reused from another loop, after
+        closing the stale one so its connector does not leak.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and not self._session.closed:
+                # Connections of a finished loop are already gone; this only releases them
+                await self._session.close()
+            self._connector = self._create_connector()
+            self._session = aiohttp.ClientSession(connector=self._connector,
+                                                  timeout=aiohttp.ClientTimeout(
+                                                      total=self.timeout,
+                                                      sock_connect=min(self.timeout, _CONNECT_TIMEOUT)))
+            self._session_loop = loop
+        return self._session
+    
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """
+        Create the TCP connector shared by every request of a run
+        
+        DNS answers are cached for the lifetime of the session, and the
+        non-blocking aiodns resolver is used when it is installed. Idle
+        connections are kept alive long enough for the follow-up probes of
+        the same endpoint to reuse them.
+        """
+        try:
+            resolver = aiohttp.AsyncResolver()
+        except RuntimeError:
+            # aiodns not installed, fall back to aiohttp's threaded resolver
+            resolver = None
+        
+        return aiohttp.TCPConnector(
+            limit=self.max_concurrent,
+            limit_per_host=self.max_concurrent,
+            keepalive_timeout=30,
+            resolver=resolver,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            family=socket.AF_INET if self.ipv4_only else 0
+        )
+    
+    async def fingerprint(self, endpoint: str) -> FingerprintResult:
+        """Fingerprint a single endpoint on the fingerprinter's long-lived session"""
+        return await self._fingerprint_single(await self._get_session(), endpoint)
     
-    async def fingerprint_multiple(self, endpoints: List[str], show_progress: bool = True) -> List[FingerprintResult]:
+    async def fingerprint_multiple(self, endpoints: List[str], show_progress: bool = True,
+                                   on_result: Optional[Callable[[FingerprintResult], None]] = None,
+                                   batch_size: Optional[int] = None) -> List[FingerprintResult]:
         """
         Fingerprint multiple endpoints concurrently with progress tracking
         
         Args:
             endpoints: List of endpoint URLs to fingerprint
             show_progress: Whether to show progress bar
+            on_result: Optional callback invoked with each result as soon as it completes
+            batch_size: Number of endpoints submitted per wave (default: all at once)
         """
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-            if show_progress:
-                # Use Rich progress bar for beautiful async progress tracking
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TaskProgressColumn(),
-                    TextColumn("[bold blue]{task.completed}/{task.total}"),
-                    TimeElapsedColumn(),
-                    TextColumn("•"),
-                    TimeRemainingColumn(),
-                    console=console,
-                    transient=False
-                ) as progress:
-                    
+        batch_size = batch_size or len(endpoints) or 1
+        session = await self._get_session()
+        
+        if show_progress or on_result is not None:
+            # Process results as they land so slow endpoints don't hold back the rest
+            ordered_results: List[Optional[FingerprintResult]] = [None] * len(endpoints)
+            
+            # Use Rich progress bar for beautiful async progress tracking
+            progress_display = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                TextColumn("[bold blue]{task.completed}/{task.total}"),
+                TimeElapsedColumn(),
+                TextColumn("•"),
+                TimeRemainingColumn(),
+                console=console,
+                transient=False,
+                refresh_per_second=_progress_refresh_rate(len(endpoints))
+            ) if show_progress else nullcontext()
+            
+            with progress_display as progress:
+                if progress is not None:
                     task = progress.add_task("🔍 Fingerprinting endpoints...", total=len(endpoints))
+                
+                # Submit endpoints in fixed-size waves to bound the number of pending tasks
+                for start in range(0, len(endpoints), batch_size):
+                    tasks = [self._fingerprint_indexed(session, i, endpoints[i])
+                             for i in range(start, min(start + batch_size, len(endpoints)))]
                     
-                    tasks = [self._fingerprint_single(session, endpoint) for endpoint in endpoints]
-                    results = []
-                    
-                    # Process tasks as they complete and update progress
                     for coro in asyncio.as_completed(tasks):
-                        try:
-                            result = await coro
-                            results.append(result)
-                        except Exception as e:
-                            # Create error result for failed endpoint
-                            error_result = FingerprintResult(
-                                endpoint="unknown",  # We'll fix this in post-processing
-                                errors=[f"Async fingerprint failed: {e}"]
-                            )
-                            results.append(error_result)
+                        index, result = await coro
+                        ordered_results[index] = result
                         
-                        progress.advance(task)
-                    
-                    # Sort results to match original endpoint order
-                    endpoint_to_result = {r.endpoint: r for r in results if r.endpoint != "unknown"}
-                    ordered_results = []
-                    error_count = 0
-                    
-                    for endpoint in endpoints:
-                        if endpoint in endpoint_to_result:
-                            ordered_results.append(endpoint_to_result[endpoint])
-                        else:
-                            # Handle unknown errors by assigning them to missing endpoints
-                            error_results = [r for r in results if r.endpoint == "unknown"]
-                            if error_count < len(error_results):
-                                error_result = error_results[error_count]
-                                error_result.endpoint = endpoint
-                                ordered_results.append(error_result)
-                                error_count += 1
-                            else:
-                                # Fallback error result
-                                ordered_results.append(FingerprintResult(
-                                    endpoint=endpoint,
-                                    errors=["Unknown error during fingerprinting"]
-                                ))
-                    
-                    return ordered_results
-            else:
-                # Original behavior without progress tracking for quiet mode
-                tasks = [self._fingerprint_single(session, endpoint) for endpoint in endpoints]
+                        if on_result is not None:
+                            on_result(result)
+                        if progress is not None:
+                            progress.advance(task)
+            
+            return ordered_results
+        else:
+            # Original behavior without progress tracking for quiet mode
+            final_results = []
+            for start in range(0, len(endpoints), batch_size):
+                batch = endpoints[start:start + batch_size]
+                tasks = [self._fingerprint_single(session, endpoint) for endpoint in batch]
                 results = await asyncio.gather(*tasks, return_exceptions=True)
                 
                 # Handle exceptions
-                final_results = []
-                for i, result in enumerate(results):
+                for endpoint, result in zip(batch, results):
                     if isinstance(result, Exception):
                         error_result = FingerprintResult(
-                            endpoint=endpoints[i],
+                            endpoint=endpoint,
                             errors=[f"Async fingerprint failed: {result}"]
                         )
                         final_results.append(error_result)
                     else:
                         final_results.append(result)
-                        
-                return final_results
+                    
+            return final_results
+    
+    async def _fingerprint_indexed(self, session: aiohttp.ClientSession, index: int,
+                                   endpoint: str) -> Tuple[int, FingerprintResult]:
+        """
+        Fingerprint a single endpoint, tagging the result with its position in the input
+        """
+        try:
+            return index, await self._fingerprint_single(session, endpoint)
+        except Exception as e:
+            return index, FingerprintResult(
+                endpoint=endpoint,
+                errors=[f"Async fingerprint failed: {e}"]
+            )
     
     async def _fingerprint_single(self, session: aiohttp.ClientSession, endpoint: str) -> FingerprintResult:
         """
@@ -742,29 +1332,22 @@ class AsyncEthereumRPCFingerprinter:
             start_time = time.time()
             
             try:
-                # Basic connectivity test
-                payload = {
-                    "jsonrpc": "2.0",
-                    "method": "web3_clientVersion",
-                    "params": [],
-                    "id": 1
-                }
+                # Every basic probe in one round trip when the node accepts batches
+                responses = await self._async_batch_rpc(session, endpoint)
+                if responses is not None:
+                    result.response_time = time.time() - start_time
+                    _apply_batch_info(result, responses, self._parse_client_version,
+                                      converters=_CONVERTERS, report_rpc_errors=False)
+                    return result
                 
-                async with session.post(endpoint, json=payload) as response:
+                # Basic connectivity test
+                async with session.post(endpoint, data=_METHOD_PAYLOADS['web3_clientVersion'],
+                                        headers=_JSON_HEADERS) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        if 'result' in data:
-                            result.client_version = data['result']
-                            result.node_implementation = self._extract_node_implementation(data['result'])
-                            
-                            # Parse detailed client information
-                            client_details = self._parse_client_version(data['result'])
-                            result.node_version = client_details.get('node_version')
-                            result.programming_language = client_details.get('programming_language')
-                            result.language_version = client_details.get('language_version')
-                            result.operating_system = client_details.get('operating_system')
-                            result.architecture = client_details.get('architecture')
-                            result.build_info = client_details.get('build_info')
+                        client_version = _extract_rpc_result(await response.read(), 'web3_clientVersion')
+                        if client_version is not _MISSING:
+                            result.client_version = client_version
+                            _apply_client_version(result, self._parse_client_version)
                             
                         result.response_time = time.time() - start_time
                     else:
@@ -779,77 +1362,64 @@ class AsyncEthereumRPCFingerprinter:
                 
             return result
     
+    async def _async_batch_rpc(self, session: aiohttp.ClientSession,
+                               endpoint: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Send the basic-info probes as one JSON-RPC batch request
+        
+        Returns a dict mapping each method to its response object, or None when
+        the endpoint does not answer the batch with a JSON array, HTTP errors
+        included (many public endpoints reject batch bodies but answer single
+        calls), in which case the caller falls back to individual calls.
+        Connection errors propagate.
+        """
+        async with session.post(endpoint, data=_BASIC_INFO_BATCH, headers=_JSON_HEADERS) as response:
+            if response.status != 200:
+                return None
+            body = await response.read()
+        
+        try:
+            data = _json_loads(body)
+        except ValueError:
+            return None
+        
+        if not isinstance(data, list):
+            return None
+        
+        # Responses may come back in any order; match them to probes by id
+        responses = {}
+        for item in data:
+            if isinstance(item, dict) and isinstance(item.get('id'), int) and 0 <= item['id'] < len(_BASIC_INFO_PROBES):
+                responses[_BASIC_INFO_PROBES[item['id']][0]] = item
+        return responses
+    
     async def _async_gather_info(self, session: aiohttp.ClientSession, endpoint: str, result: FingerprintResult):
         """Gather additional information asynchronously"""
-        methods_to_test = [
-            ("net_version", "network_id"),
-            ("eth_chainId", "chain_id"),
-            ("eth_blockNumber", "block_number"),
-            ("eth_gasPrice", "gas_price"),
-            ("net_peerCount", "peer_count"),
-            ("eth_syncing", "syncing"),
-            ("eth_mining", "mining"),
-            ("eth_hashrate", "hashrate"),
-            ("eth_accounts", "accounts"),
-            ("eth_protocolVersion", "protocol_version")
-        ]
+        get_converter = _CONVERTERS.get
         
-        for method, attr_name in methods_to_test:
+        for method, attr_name in _METHODS_TO_TEST:
             try:
-                payload = {
-                    "jsonrpc": "2.0",
-                    "method": method,
-                    "params": [],
-                    "id": 1
-                }
-                
-                async with session.post(endpoint, json=payload) as response:
+                async with session.post(endpoint, data=_METHOD_PAYLOADS[method], headers=_JSON_HEADERS) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        if 'result' in data:
-                            value = data['result']
+                        value = _extract_rpc_result(await response.read(), method)
+                        if value is not _MISSING:
                             # Convert hex values to int where appropriate
-                            if method in ['net_version', 'eth_chainId', 'eth_blockNumber', 'eth_gasPrice', 'net_peerCount', 'eth_hashrate']:
-                                if isinstance(value, str) and value.startswith('0x'):
-                                    value = int(value, 16)
-                                elif isinstance(value, str) and value.isdigit():
-                                    value = int(value)
-                            setattr(result, attr_name, value)
+                            setattr(result, attr_name, get_converter(method, _identity)(value))
                             
             except Exception as e:
                 result.errors.append(f"Failed to get {method}: {e}")
 
     def _extract_node_implementation(self, client_version: str) -> Optional[str]:
         """Extract node implementation from client version string"""
-        if not client_version or not client_version.strip():
-            return None
-            
-        client_lower = client_version.lower()
-        
-        if 'geth' in client_lower or 'turbogeth' in client_lower:
-            return 'Geth'
-        elif 'parity' in client_lower or 'openethereum' in client_lower:
-            return 'Parity/OpenEthereum'
-        elif 'besu' in client_lower:
-            return 'Besu'
-        elif 'nethermind' in client_lower:
-            return 'Nethermind'
-        elif 'erigon' in client_lower:
-            return 'Erigon'
-        elif 'reth' in client_lower:
-            return 'Reth'
-        elif 'hardhat' in client_lower:
-            return 'Hardhat'
-        elif 'ethereumjs' in client_lower:
-            return 'EthereumJS'
-        elif 'anvil' in client_lower:
-            return 'Anvil'
-        elif 'ganache' in client_lower or 'testrpc' in client_lower:
-            return 'Ganache'
-        else:
-            return 'Unknown'
+        return _detect_node_implementation(client_version)
     
     def _parse_client_version(self, client_version: str) -> Dict[str, Optional[str]]:
+        """Parse client version string, reusing earlier parses of the same string"""
+        return _copy_client_details(self._parse_client_version_cached(client_version))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_client_version_cached(client_version: str) -> Dict[str, Optional[str]]:
         """
         Parse client version string to extract detailed information
         """
@@ -877,8 +1447,7 @@ class AsyncEthereumRPCFingerprinter:
             impl_part = parts[0]
             
             # Extract version number (look for patterns like v1.2.3, 1.2.3, etc.)
-            import re
-            version_match = re.search(r'v?(\d+\.\d+\.\d+(?:[.-]\w+)*)', impl_part)
+            version_match = _IMPL_VERSION_RE.search(impl_part)
             if version_match:
                 result['node_version'] = version_match.group(1)
             
@@ -916,35 +1485,35 @@ class AsyncEthereumRPCFingerprinter:
                 elif 'go' in part_lower:
                     result['programming_language'] = 'Go'
                     # Extract Go version (e.g., go1.21.4)
-                    go_match = re.search(r'go(\d+\.\d+(?:\.\d+)?)', part_lower)
+                    go_match = _GO_VERSION_RE.search(part_lower)
                     if go_match:
                         result['language_version'] = go_match.group(1)
                 
                 elif 'java' in part_lower or 'openjdk' in part_lower:
                     result['programming_language'] = 'Java'
                     # Extract Java version (e.g., java-17, openjdk-java-17)
-                    java_match = re.search(r'java[-]?(\d+)', part_lower)
+                    java_match = _JAVA_MAJOR_RE.search(part_lower)
                     if java_match:
                         result['language_version'] = java_match.group(1)
                 
                 elif 'dotnet' in part_lower or '.net' in part_lower:
                     result['programming_language'] = '.NET'
                     # Extract .NET version (e.g., dotnet8.0.0)
-                    dotnet_match = re.search(r'dotnet(\d+\.\d+(?:\.\d+)?)', part_lower)
+                    dotnet_match = _DOTNET_VERSION_RE.search(part_lower)
                     if dotnet_match:
                         result['language_version'] = dotnet_match.group(1)
                 
                 elif 'rust' in part_lower:
                     result['programming_language'] = 'Rust'
                     # Extract Rust version if present
-                    rust_match = re.search(r'rust[-]?(\d+\.\d+(?:\.\d+)?)', part_lower)
+                    rust_match = _RUST_VERSION_RE.search(part_lower)
                     if rust_match:
                         result['language_version'] = rust_match.group(1)
                 
                 # Build info (commit hashes, timestamps, etc.)
-                elif re.match(r'^[a-f0-9]{7,}', part) or '+' in part:
+                elif _COMMIT_PREFIX_RE.match(part) or '+' in part:
                     # Try to identify what type of build info this is
-                    if re.match(r'^[a-f0-9]{7,}$', part):
+                    if _COMMIT_HASH_RE.match(part):
                         result['build_info']['commit_hash'] = part
                     elif '+' in part:
                         result['build_info']['build_info'] = part
@@ -996,6 +1565,49 @@ class AsyncEthereumRPCFingerprinter:
         return result
 
 
+def _fingerprint_threaded(make_fingerprinter: Callable[[], EthereumRPCFingerprinter], endpoints: List[str],
+                          max_workers: int, on_done: Optional[Callable[[], None]] = None) -> List[FingerprintResult]:
+    """
+    Fingerprint endpoints on a thread pool, returning results in input order
+    
+    Each worker thread builds its own fingerprinter, and with it its own
+    requests.Session, so connection pools are never shared across threads.
+    """
+    results: List[Optional[FingerprintResult]] = [None] * len(endpoints)
+    local = threading.local()
+    
+    def init_worker():
+        local.fingerprinter = make_fingerprinter()
+    
+    def run(endpoint: str) -> FingerprintResult:
+        return local.fingerprinter.fingerprint(endpoint)
+    
+    with ThreadPoolExecutor(max_workers=max_workers, initializer=init_worker) as executor:
+        futures = {executor.submit(run, endpoint): i for i, endpoint in enumerate(endpoints)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if on_done:
+                on_done()
+    
+    return results
+
+
+def _run_coroutine(coro):
+    """Run a coroutine to completion, on a uvloop event loop when available"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+# Rich styles for vulnerability severities
+_SEVERITY_STYLES = {
+    "CRITICAL": "bold red",
+    "HIGH": "bold orange3",
+    "MEDIUM": "yellow",
+    "LOW": "bright_blue"
+}
+
+
 def print_fingerprint_result(result: FingerprintResult):
     """Print fingerprint result using Rich formatting"""
     
@@ -1199,13 +1811,7 @@ def print_fingerprint_result(result: FingerprintResult):
             
             for vuln in result.vulnerabilities:
                 # Style severity with colors
-                severity_styles = {
-                    "CRITICAL": "bold red",
-                    "HIGH": "bold orange3", 
-                    "MEDIUM": "yellow",
-                    "LOW": "bright_blue"
-                }
-                severity_style = severity_styles.get(vuln.severity, "white")
+                severity_style = _SEVERITY_STYLES.get(vuln.severity, "white")
                 
                 # Style CVSS score with colors
                 cvss_style = "white"
@@ -1248,6 +1854,17 @@ def print_fingerprint_result(result: FingerprintResult):
     console.print()
 
 
+@functools.lru_cache(maxsize=None)
+def _yaml_dumper(yaml):
+    """Return PyYAML's libyaml-backed dumper when it was built with it"""
+    base = getattr(yaml, 'CDumper', yaml.Dumper)
+    
+    # Emit bounded error lists as plain YAML sequences
+    dumper = type('_FingerprintDumper', (base,), {})
+    dumper.add_representer(_ErrorList, base.represent_list)
+    return dumper
+
+
 def _save_results(results: List[FingerprintResult], output_path: str, format_type: str, verbose: bool = False):
     """Save results to file in specified format"""
     if verbose:
@@ -1256,14 +1873,13 @@ def _save_results(results: List[FingerprintResult], output_path: str, format_typ
     data = [asdict(result) for result in results]
     
     try:
-        with open(output_path, 'w') as f:
-            if format_type == 'json':
-                json.dump(data, f, indent=2, default=str)
-            elif format_type == 'yaml':
-                import yaml
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            else:  # table format - save as JSON but display as table
-                json.dump(data, f, indent=2, default=str)
+        if format_type == 'yaml':
+            import yaml
+            with open(output_path, 'w') as f:
+                yaml.dump(data, f, Dumper=_yaml_dumper(yaml), default_flow_style=False, sort_keys=False)
+        else:  # json, or table format - save as JSON but display as table
+            with open(output_path, 'wb') as f:
+                f.write(_json_dumps_pretty(data))
     except Exception as e:
         click.echo(f"❌ Failed to save results: {e}", err=True)
         raise
@@ -1273,11 +1889,11 @@ def _display_results(results: List[FingerprintResult], format_type: str):
     """Display results in specified format"""
     if format_type == 'json':
         data = [asdict(result) for result in results]
-        click.echo(json.dumps(data, indent=2, default=str))
+        click.echo(_json_dumps_pretty(data).decode('utf-8'))
     elif format_type == 'yaml':
         import yaml
         data = [asdict(result) for result in results]
-        click.echo(yaml.dump(data, default_flow_style=False, sort_keys=False))
+        click.echo(yaml.dump(data, Dumper=_yaml_dumper(yaml), default_flow_style=False, sort_keys=False))
     else:  # table format (default)
         for i, result in enumerate(results):
             if i > 0:
@@ -1360,6 +1976,28 @@ def list_implementations(include_dev):
             click.echo(f"  • {Fore.CYAN}{name}{Style.RESET_ALL}: {description}")
 
 
+# Endpoint lines in a URL file: an http(s)/ws(s) URL, optionally indented
+_URL_LINE_RE = re.compile(r'(?m)^[ \t]*((?:https?|wss?)://\S+)')
+
+
+def _read_file_endpoints(path: str, verbose: bool = False) -> List[str]:
+    """
+    Read endpoint URLs from a file with one URL per line
+    
+    Blank lines, comments and lines without a supported URL scheme are skipped.
+    """
+    if verbose:
+        click.echo(f"📁 Reading endpoints from file: {path}")
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        file_endpoints = _URL_LINE_RE.findall(f.read())
+    
+    if verbose:
+        click.echo(f"📄 Loaded {len(file_endpoints)} endpoints from file")
+    
+    return file_endpoints
+
+
 # Add the main command to the CLI group as the default
 @cli.command(name='fingerprint')
 @click.argument('endpoints', nargs=-1, required=False)
@@ -1371,9 +2009,11 @@ def list_implementations(include_dev):
 @click.option('--quiet', '-q', is_flag=True, help='Only output JSON, no formatted display')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json', 'yaml']), 
               default='table', help='Output format', show_default=True)
-@click.option('--max-concurrent', default=10, help='Maximum concurrent requests for async mode', show_default=True)
+@click.option('--max-concurrent', default=10, help='Maximum concurrent requests', show_default=True)
+@click.option('--batch-size', type=click.IntRange(min=1), default=None,
+              help='Endpoints submitted per async wave [default: max(4 x max-concurrent, 256)]')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-def fingerprint_command(endpoints, endpoints_file, timeout, async_mode, output, quiet, output_format, max_concurrent, verbose):
+def fingerprint_command(endpoints, endpoints_file, timeout, async_mode, output, quiet, output_format, max_concurrent, batch_size, verbose):
     """
     Fingerprint Ethereum RPC endpoints.
     
@@ -1409,41 +2049,16 @@ def fingerprint_command(endpoints, endpoints_file, timeout, async_mode, output,
     if not endpoints and not endpoints_file:
         raise click.UsageError("Either provide endpoint URLs or use --file option")
     
-    # Collect all endpoints
-    all_endpoints = list(endpoints) if endpoints else []
+    # Collect all endpoints, dropping duplicates while keeping first-seen order
+    try:
+        file_endpoints = _read_file_endpoints(endpoints_file, verbose) if endpoints_file else []
+    except Exception as e:
+        raise click.ClickException(f"Error reading file {endpoints_file}: {str(e)}")
     
-    # Read endpoints from file if provided
-    if endpoints_file:
-        if verbose:
-            click.echo(f"📁 Reading endpoints from file: {endpoints_file}")
-        
-        try:
-            with open(endpoints_file, 'r', encoding='utf-8') as f:
-                file_endpoints = []
-                line_num = 0
-                for line in f:
-                    line_num += 1
-                    line = line.strip()
-                    
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Basic URL validation
-                    if not (line.startswith('http://') or line.startswith('https://') or line.startswith('wss://') or line.startswith('ws://')):
-                        if verbose:
-                            click.echo(f"⚠️  Skipping invalid URL on line {line_num}: {line}", err=True)
-                        continue
-                    
-                    file_endpoints.append(line)
-                
-                all_endpoints.extend(file_endpoints)
-                
-                if verbose:
-                    click.echo(f"📄 Loaded {len(file_endpoints)} endpoints from file")
-        
-        except Exception as e:
-            raise click.ClickException(f"Error reading file {endpoints_file}: {str(e)}")
+    collected = len(endpoints) + len(file_endpoints)
+    all_endpoints = list(dict.fromkeys(itertools.chain(endpoints, file_endpoints)))
+    if verbose and collected > len(all_endpoints):
+        click.echo(f"🧹 Deduped {collected - len(all_endpoints)} duplicate endpoints")
     
     if not all_endpoints:
         raise click.ClickException("No valid endpoints found")
@@ -1451,10 +2066,28 @@ def fingerprint_command(endpoints, endpoints_file, timeout, async_mode, output,
     if verbose:
         click.echo(f"🎯 Total endpoints to fingerprint: {len(all_endpoints)}")
     
-    return main(all_endpoints, timeout, async_mode, output, quiet, output_format, max_concurrent, verbose)
+    return main(all_endpoints, timeout, async_mode, output, quiet, output_format, max_concurrent, verbose,
+                batch_size=batch_size)
+
+
+async def amain(endpoints: List[str], timeout: int = 10, max_concurrent: int = 10, show_progress: bool = True,
+                on_result: Optional[Callable[[FingerprintResult], None]] = None,
+                batch_size: Optional[int] = None) -> List[FingerprintResult]:
+    """
+    Async fingerprinting entry point for callers that already run an event loop
+    
+    Returns the results in input order; batch_size defaults to max(4 x max_concurrent, 256).
+    """
+    async with AsyncEthereumRPCFingerprinter(timeout=timeout, max_concurrent=max_concurrent) as fingerprinter:
+        return await fingerprinter.fingerprint_multiple(
+            list(endpoints),
+            show_progress=show_progress,
+            on_result=on_result,
+            batch_size=batch_size or max(max_concurrent * 4, 256)
+        )
 
 
-def main(endpoints, timeout, async_mode, output, quiet, output_format, max_concurrent, verbose):
+def main(endpoints, timeout, async_mode, output, quiet, output_format, max_concurrent, verbose, batch_size=None):
     """Core fingerprinting logic"""
     if verbose:
         console.print("🔍 Starting fingerprinting of [bold cyan]{}[/bold cyan] endpoint(s)...".format(len(endpoints)))
@@ -1466,17 +2099,26 @@ def main(endpoints, timeout, async_mode, output, quiet, output_format, max_concu
             if verbose:
                 console.print("🚀 Using [bold green]async fingerprinting mode[/bold green]")
             
-            async def run_async():
-                fingerprinter = AsyncEthereumRPCFingerprinter(timeout=timeout, max_concurrent=max_concurrent)
-                return await fingerprinter.fingerprint_multiple(list(endpoints), show_progress=not quiet)
+            # Table output is printed as each endpoint completes
+            streamed = output_format == 'table' and not quiet
             
-            results = asyncio.run(run_async())
+            results = _run_coroutine(amain(
+                endpoints, timeout, max_concurrent,
+                show_progress=not quiet,
+                on_result=print_fingerprint_result if streamed else None,
+                batch_size=batch_size
+            ))
         else:
             if verbose:
                 console.print("🔄 Using [bold blue]synchronous fingerprinting mode[/bold blue]")
             
             fingerprinter = EthereumRPCFingerprinter(timeout=timeout)
             results = []
+            streamed = False
+            
+            # Worker threads get their own sessions but share the loaded CVE database
+            def make_fingerprinter():
+                return EthereumRPCFingerprinter(timeout=timeout, cve_database=fingerprinter.cve_database)
             
             if len(endpoints) > 1 and not quiet:
                 # Use Rich progress bar for beautiful synchronous progress tracking
@@ -1488,14 +2130,15 @@ def main(endpoints, timeout, async_mode, output, quiet, output_format, max_concu
                     TimeElapsedColumn(),
                     TimeRemainingColumn(),
                     console=console,
-                    refresh_per_second=10,
+                    refresh_per_second=_progress_refresh_rate(len(endpoints)),
                 ) as progress:
                     task = progress.add_task("🔍 Fingerprinting endpoints...", total=len(endpoints))
-                    
-                    for endpoint in endpoints:
-                        result = fingerprinter.fingerprint(endpoint)
-                        results.append(result)
-                        progress.advance(task)
+                    results = _fingerprint_threaded(
+                        make_fingerprinter, endpoints, max_concurrent,
+                        on_done=lambda: progress.advance(task)
+                    )
+            elif len(endpoints) > 1:
+                results = _fingerprint_threaded(make_fingerprinter, endpoints, max_concurrent)
             else:
                 for endpoint in endpoints:
                     result = fingerprinter.fingerprint(endpoint)
@@ -1507,8 +2150,8 @@ def main(endpoints, timeout, async_mode, output, quiet, output_format, max_concu
             if not quiet:
                 click.echo(f"✅ Results saved to {output}")
         
-        # Display results unless quiet mode
-        if not quiet:
+        # Display results unless quiet mode or already streamed
+        if not quiet and not streamed:
             _display_results(results, output_format)
             
     except KeyboardInterrupt:
@@ -1532,7 +2175,7 @@ if __name__ == "__main__":
     @click.option('--quiet', '-q', is_flag=True, help='Only output JSON, no formatted display')
     @click.option('--format', 'output_format', type=click.Choice(['table', 'json', 'yaml']), 
                   default='table', help='Output format', show_default=True)
-    @click.option('--max-concurrent', default=10, help='Maximum concurrent requests for async mode', show_default=True)
+    @click.option('--max-concurrent', default=10, help='Maximum concurrent requests', show_default=True)
     @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
     @click.version_option(version='1.0.0', prog_name='ethereum-rpc-fingerprinter')
     def standalone_main(endpoints, timeout, async_mode, output, quiet, output_format, max_concurrent, verbose):
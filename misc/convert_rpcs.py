@@ -5,35 +5,42 @@ Extracts only RPC URLs (http/https/ws/wss) excluding block explorers.
 """
 
 import json
+import os
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+
+# RPC URLs typically start with http/https/ws/wss
+_RPC_RE = re.compile(r'^(https?|wss?)://')
+
+# Obvious block explorers and non-RPC services, matched in a single scan
+_SKIP_PATTERNS = (
+    'explorer', 'scan', 'etherscan', 'blockscout', 'dexguru',
+    'routescan', 'polygonscan', 'arbiscan', 'basescan',
+    'faucet', 'bridge', 'swap', 'dex', 'superscan'
+)
+_SKIP_RE = re.compile('|'.join(map(re.escape, _SKIP_PATTERNS)), re.IGNORECASE)
+
+# Chains handled per worker process before a parallel split pays off
+_MIN_CHAINS_PER_SHARD = 500
 
 def is_rpc_url(url):
     """Check if URL is an RPC endpoint (not explorer/faucet)"""
-    # RPC URLs typically start with http/https/ws/wss
-    if not re.match(r'^(https?|wss?)://', url):
+    if not _RPC_RE.match(url):
         return False
     
     # Skip obvious block explorers and non-RPC services
-    skip_patterns = [
-        'explorer', 'scan', 'etherscan', 'blockscout', 'dexguru',
-        'routescan', 'polygonscan', 'arbiscan', 'basescan',
-        'faucet', 'bridge', 'swap', 'dex', 'superscan'
-    ]
-    
-    url_lower = url.lower()
-    for pattern in skip_patterns:
-        if pattern in url_lower:
-            return False
-    
-    return True
+    return not _SKIP_RE.search(url)
 
-def extract_rpc_urls(json_file_path, output_file_path):
-    """Extract RPC URLs from chains JSON file"""
-    
-    with open(json_file_path, 'r') as f:
-        chains = json.load(f)
-    
-    rpc_urls = set()  # Use set to avoid duplicates
+def _extract_from_chains(chains):
+    """Collect the RPC URLs of a shard of chains"""
+    rpc_urls = set()
     
     for chain in chains:
         # Extract from 'rpc' field
@@ -57,28 +64,45 @@ def extract_rpc_urls(json_file_path, output_file_path):
                 if is_rpc_url(url):
                     rpc_urls.add(url)
     
+    return rpc_urls
+
+def extract_rpc_urls(json_file_path, output_file_path, workers=None):
+    """Extract RPC URLs from chains JSON file"""
+    
+    with open(json_file_path, 'rb') as f:
+        chains = _json_loads(f.read())
+    
+    # Shard large chain lists across processes; small ones aren't worth the startup cost
+    workers = workers or os.cpu_count() or 1
+    shard_count = min(workers, len(chains) // _MIN_CHAINS_PER_SHARD)
+    
+    if shard_count > 1:
+        shard_size = -(-len(chains) // shard_count)
+        shards = [chains[i:i + shard_size] for i in range(0, len(chains), shard_size)]
+        with ProcessPoolExecutor(max_workers=shard_count) as executor:
+            rpc_urls = set().union(*executor.map(_extract_from_chains, shards))
+    else:
+        rpc_urls = _extract_from_chains(chains)
+    
     # Convert to sorted list for consistent output
     sorted_urls = sorted(list(rpc_urls))
     
     # Write to output file
-    with open(output_file_path, 'w') as f:
-        for url in sorted_urls:
-            f.write(url + '\n')
+    with open(output_file_path, 'w', buffering=1 << 20) as f:
+        if sorted_urls:
+            f.write('\n'.join(sorted_urls) + '\n')
     
     print(f"✅ Extracted {len(sorted_urls)} unique RPC endpoints")
     print(f"📝 Written to: {output_file_path}")
     
     # Show some statistics
-    http_count = sum(1 for url in sorted_urls if url.startswith('http://'))
-    https_count = sum(1 for url in sorted_urls if url.startswith('https://'))
-    ws_count = sum(1 for url in sorted_urls if url.startswith('ws://'))
-    wss_count = sum(1 for url in sorted_urls if url.startswith('wss://'))
+    scheme_counts = Counter(url.split('://', 1)[0] for url in sorted_urls)
     
     print(f"\n📊 URL Statistics:")
-    print(f"   HTTP:  {http_count}")
-    print(f"   HTTPS: {https_count}")
-    print(f"   WS:    {ws_count}")
-    print(f"   WSS:   {wss_count}")
+    print(f"   HTTP:  {scheme_counts['http']}")
+    print(f"   HTTPS: {scheme_counts['https']}")
+    print(f"   WS:    {scheme_counts['ws']}")
+    print(f"   WSS:   {scheme_counts['wss']}")
     
     # Show first few URLs as preview
     print(f"\n🔍 Preview (first 10 URLs):")
@@ -3,7 +3,7 @@
 Example usage of the Ethereum RPC Fingerprinting Tool
 """
 
-from ethereum_rpc_fingerprinter import EthereumRPCFingerprinter, AsyncEthereumRPCFingerprinter, print_fingerprint_result
+from ethereum_rpc_fingerprinter import EthereumRPCFingerprinter, amain, print_fingerprint_result
 import asyncio
 import json
 
@@ -39,14 +39,12 @@ def main():
     print("-" * 50)
     
     async def async_example():
-        async_fingerprinter = AsyncEthereumRPCFingerprinter(timeout=5, max_concurrent=3)
-        
         # Filter to only localhost endpoints for demo
         test_endpoints = [ep for ep in endpoints if "localhost" in ep]
         
         print(f"Testing {len(test_endpoints)} endpoints asynchronously...")
         
-        results = await async_fingerprinter.fingerprint_multiple(test_endpoints)
+        results = await amain(test_endpoints, timeout=5, max_concurrent=3)
         
         for result in results:
             print_fingerprint_result(result)
@@ -64,6 +62,7 @@ def main():
     def analyze_node_implementation(endpoint):
         """Analyze specific characteristics of a node implementation"""
         result = fingerprinter.fingerprint(endpoint)
+        info = result.additional_info or {}
         
         if result.node_implementation:
             print(f"Detected Implementation: {result.node_implementation}")
@@ -71,9 +70,9 @@ def main():
             # Implementation-specific analysis
             if result.node_implementation == 'Geth':
                 print("🔹 Geth-specific features detected:")
-                if result.additional_info and result.additional_info.get('admin_namespace'):
+                if info.get('admin_namespace'):
                     print("  ✓ Admin namespace available")
-                if result.additional_info and result.additional_info.get('txpool_namespace'):
+                if info.get('txpool_namespace'):
                     print("  ✓ Txpool namespace available")
                     
             elif result.node_implementation == 'Parity/OpenEthereum':
@@ -96,23 +95,25 @@ def main():
     def security_analysis(endpoint):
         """Perform security-focused analysis"""
         result = fingerprinter.fingerprint(endpoint)
+        info = result.additional_info or {}
+        accounts = result.accounts or ()
         
         security_issues = []
         
         # Check for exposed accounts
-        if result.accounts and len(result.accounts) > 0:
-            security_issues.append(f"⚠️  {len(result.accounts)} accounts exposed")
+        if accounts:
+            security_issues.append(f"⚠️  {len(accounts)} accounts exposed")
         
         # Check for mining capability
         if result.mining:
             security_issues.append("⚠️  Mining is active")
         
         # Check for admin namespace
-        if result.additional_info and result.additional_info.get('admin_namespace'):
+        if info.get('admin_namespace'):
             security_issues.append("⚠️  Admin namespace is accessible")
         
         # Check for debug namespace
-        if result.additional_info and result.additional_info.get('debug_namespace'):
+        if info.get('debug_namespace'):
             security_issues.append("⚠️  Debug namespace is accessible")
         
         if security_issues:
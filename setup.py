@@ -49,6 +49,9 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=read_requirements(),
+    extras_require={
+        "speedups": ["aiodns>=3.0.0", "pyahocorasick>=2.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "ethereum-rpc-fingerprinter=ethereum_rpc_fingerprinter:cli",
@@ -0,0 +1,42 @@
+"""
+Shared event loop for the async tests.
+
+Creating and closing a loop per test costs selector and thread setup, so
+the suite keeps one loop alive per process and closes it at exit. The loop
+is created on first use in each process: a loop inherited through fork
+shares its epoll instance and self-pipe with the parent, so a forked test
+worker gets its own instead.
+"""
+
+import asyncio
+import atexit
+import os
+
+_loop = None
+_loop_pid = None
+
+# Loops inherited through fork; kept referenced so garbage collection never
+# closes them, which would unregister the parent's descriptors from the shared epoll
+_inherited_loops = []
+
+
+def _get_loop():
+    """Return this process's test loop, creating it on first use."""
+    global _loop, _loop_pid
+    if _loop_pid != os.getpid():
+        if _loop is not None:
+            _inherited_loops.append(_loop)
+        _loop = asyncio.new_event_loop()
+        _loop_pid = os.getpid()
+    return _loop
+
+
+@atexit.register
+def _close_loop():
+    if _loop is not None and _loop_pid == os.getpid():
+        _loop.close()
+
+
+def run_async(coro):
+    """Run a coroutine to completion on the shared test loop."""
+    return _get_loop().run_until_complete(coro)
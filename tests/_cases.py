@@ -0,0 +1,40 @@
+"""
+Table-driven test methods for unittest.TestCase classes.
+
+A method decorated with ``cases`` is replaced by one generated test method
+per parameter set, so every case runs and reports on its own under both
+unittest (and tests/test_runner.py) and pytest.
+"""
+
+
+def cases(param_sets):
+    """Mark a TestCase method to be expanded into one test per parameter tuple."""
+    def decorate(func):
+        func._param_sets = tuple(param_sets)
+        return func
+    return decorate
+
+
+def _case_method(func, name, params):
+    def test(self):
+        func(self, *params)
+    
+    test.__name__ = name
+    # The first docstring line is what verbose unittest output shows for a test
+    summary = (func.__doc__ or func.__name__).strip().splitlines()[0]
+    test.__doc__ = f"{summary} {params!r}"
+    return test
+
+
+def expand_cases(cls):
+    """Class decorator generating test_<name>_<index> methods from the ``cases`` methods of cls."""
+    for name, func in list(vars(cls).items()):
+        param_sets = getattr(func, "_param_sets", None)
+        if param_sets is None:
+            continue
+        delattr(cls, name)
+        for index, params in enumerate(param_sets):
+            method = _case_method(func, f"{name}_{index}", params)
+            method.__qualname__ = f"{cls.__qualname__}.{method.__name__}"
+            setattr(cls, method.__name__, method)
+    return cls
@@ -0,0 +1,22 @@
+"""
+Shared pytest configuration for the test suite.
+
+When pytest-xdist is installed the suite runs across all cores, one test
+class per worker, unless a worker count was given explicitly with -n.
+"""
+
+import pytest
+
+# The unittest runner imports every TestCase class; collecting it would run them twice
+collect_ignore = ["test_runner.py"]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Default to ``-n auto --dist=loadscope`` when pytest-xdist is available."""
+    if not config.pluginmanager.hasplugin("xdist") or hasattr(config, "workerinput"):
+        return
+    if config.option.numprocesses is None and not config.option.usepdb:
+        config.option.numprocesses = "auto"
+        if config.option.dist == "no":
+            config.option.dist = "loadscope"
@@ -149,6 +149,20 @@ class TestClientVersionParsing(unittest.TestCase):
         
         # build_info should be a dict
         self.assertIsInstance(result['build_info'], dict)
+    
+    def test_cached_parse_returns_independent_copies(self):
+        """Test that repeated parses are cached but callers get their own dicts."""
+        version_str = "Nethermind/v1.14.6+6c21356f/linux-x64/dotnet6.0.11"
+        first = self.fingerprinter._parse_client_version(version_str)
+        hits = EthereumRPCFingerprinter._parse_client_version_cached.cache_info().hits
+        
+        first['node_version'] = 'changed'
+        first['build_info']['extra'] = 'changed'
+        second = self.fingerprinter._parse_client_version(version_str)
+        
+        self.assertEqual(EthereumRPCFingerprinter._parse_client_version_cached.cache_info().hits, hits + 1)
+        self.assertNotEqual(second['node_version'], 'changed')
+        self.assertNotIn('extra', second['build_info'])
 
 
 if __name__ == '__main__':
@@ -4,12 +4,109 @@ Unit tests for CVE database functionality and vulnerability detection.
 """
 
 import unittest
+import copy
 import json
 import tempfile
 import os
+import shutil
+import pytest
 from unittest.mock import patch, MagicMock
-from cve_database import CVEDatabase, Vulnerability, check_software_vulnerabilities
+from cve_database import CVEDatabase, Vulnerability, check_software_vulnerabilities, import_json
 from ethereum_rpc_fingerprinter import EthereumRPCFingerprinter, FingerprintResult
+from _cases import cases, expand_cases
+
+
+# Minimal test database shared by the CVE database tests
+TEST_DB_DATA = {
+    "metadata": {
+        "database_version": "1.0.0",
+        "last_updated": "2024-01-01"
+    },
+    "vulnerabilities": {
+        "geth": [
+            {
+                "cve_id": "CVE-2021-39137",
+                "title": "Geth consensus flaw",
+                "description": "Test vulnerability",
+                "severity": "CRITICAL",
+                "cvss_score": 9.8,
+                "affected_versions": {
+                    "type": "range",
+                    "min": "1.10.0",
+                    "max": "1.10.7"
+                },
+                "fixed_in": "1.10.8",
+                "published_date": "2021-08-24",
+                "references": ["https://example.com"],
+                "impact": "Could lead to chain splits",
+                "recommendation": "Update immediately"
+            }
+        ],
+        "parity": [
+            {
+                "cve_id": "CVE-2018-19486",
+                "title": "Parity DoS vulnerability",
+                "description": "Test DoS vulnerability",
+                "severity": "MEDIUM",
+                "cvss_score": 5.3,
+                "affected_versions": {
+                    "type": "range",
+                    "min": "2.0.0",
+                    "max": "2.2.4"
+                },
+                "fixed_in": "2.2.5",
+                "published_date": "2018-11-26",
+                "references": ["https://example.com"],
+                "impact": "Denial of service",
+                "recommendation": "Update to 2.2.5"
+            }
+        ]
+    },
+    "severity_mapping": {
+        "CRITICAL": {"color": "red", "priority": "IMMEDIATE"},
+        "HIGH": {"color": "orange", "priority": "HIGH"},
+        "MEDIUM": {"color": "yellow", "priority": "MEDIUM"},
+        "LOW": {"color": "green", "priority": "LOW"}
+    }
+}
+
+
+# (software name, normalized name)
+NAME_NORMALIZATION_CASES = [
+    ("Geth", "geth"),
+    ("GETH", "geth"),
+    ("go-ethereum", "geth"),
+    ("Parity-Ethereum", "parity"),
+    ("OpenEthereum", "parity"),
+    ("Parity/OpenEthereum", "parity"),
+    ("Besu", "besu"),
+    ("Hyperledger_Besu", "besu"),
+    ("hyperledger-besu", "besu"),
+    ("Nethermind", "nethermind"),
+    ("Unknown Client", "unknown client")
+]
+
+# (version string, parsed version, or None when unparseable)
+VERSION_PARSING_CASES = [
+    ("1.10.7", "1.10.7"),
+    ("v1.10.7", "1.10.7"),
+    ("1.10.7-stable", "1.10.7"),
+    ("1.10.7-beta", "1.10.7"),
+    ("1.10.7+build123", "1.10.7"),
+    ("2.2.4-alpha.1", "2.2.4"),
+    ("invalid-version", None)
+]
+
+GETH_RANGE_CASES = [
+    # Vulnerable versions
+    ("1.10.0", ["CVE-2021-39137"]),
+    ("1.10.3", ["CVE-2021-39137"]),
+    ("1.10.7", ["CVE-2021-39137"]),
+    # Safe versions
+    ("1.9.9", []),
+    ("1.10.8", []),
+    ("1.11.0", [])
+]
 
 
 class TestVulnerabilityDataClass(unittest.TestCase):
@@ -70,75 +167,48 @@ class TestVulnerabilityDataClass(unittest.TestCase):
             )
 
 
+@expand_cases
 class TestCVEDatabase(unittest.TestCase):
     """Test CVE database functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a minimal test database
-        self.test_db_data = {
-            "metadata": {
-                "database_version": "1.0.0",
-                "last_updated": "2024-01-01"
-            },
-            "vulnerabilities": {
-                "geth": [
-                    {
-                        "cve_id": "CVE-2021-39137",
-                        "title": "Geth consensus flaw",
-                        "description": "Test vulnerability",
-                        "severity": "CRITICAL",
-                        "cvss_score": 9.8,
-                        "affected_versions": {
-                            "type": "range",
-                            "min": "1.10.0",
-                            "max": "1.10.7"
-                        },
-                        "fixed_in": "1.10.8",
-                        "published_date": "2021-08-24",
-                        "references": ["https://example.com"],
-                        "impact": "Could lead to chain splits",
-                        "recommendation": "Update immediately"
-                    }
-                ],
-                "parity": [
-                    {
-                        "cve_id": "CVE-2018-19486",
-                        "title": "Parity DoS vulnerability",
-                        "description": "Test DoS vulnerability",
-                        "severity": "MEDIUM",
-                        "cvss_score": 5.3,
-                        "affected_versions": {
-                            "type": "range",
-                            "min": "2.0.0",
-                            "max": "2.2.4"
-                        },
-                        "fixed_in": "2.2.5",
-                        "published_date": "2018-11-26",
-                        "references": ["https://example.com"],
-                        "impact": "Denial of service",
-                        "recommendation": "Update to 2.2.5"
-                    }
-                ]
-            },
-            "severity_mapping": {
-                "CRITICAL": {"color": "red", "priority": "IMMEDIATE"},
-                "HIGH": {"color": "orange", "priority": "HIGH"},
-                "MEDIUM": {"color": "yellow", "priority": "MEDIUM"},
-                "LOW": {"color": "green", "priority": "LOW"}
-            }
-        }
-        
-        # Create temporary database file
-        self.temp_db_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-        json.dump(self.test_db_data, self.temp_db_file)
-        self.temp_db_file.close()
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared test database once for the class."""
+        cls.test_db_data = TEST_DB_DATA
+        cls.cve_db = CVEDatabase.from_dict(cls.test_db_data)
+    
+    def test_database_loading_from_file(self):
+        """Test that the database loads correctly from a JSON file."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(self.test_db_data, f)
+        self.addCleanup(os.unlink, f.name)
         
-        self.cve_db = CVEDatabase(self.temp_db_file.name)
+        cve_db = CVEDatabase(f.name)
+        self.assertEqual(cve_db.database_path, f.name)
+        self.assertEqual(cve_db.metadata["database_version"], "1.0.0")
+        self.assertEqual(len(cve_db.vulnerabilities['geth']), 1)
+        self.assertEqual(len(cve_db.vulnerabilities['parity']), 1)
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.unlink(self.temp_db_file.name)
+    def test_database_loading_from_sqlite(self):
+        """Test that a SQLite file built by import_json answers like the JSON file."""
+        tmpdir = tempfile.mkdtemp()
+        # Cleanups run last-in-first-out: the database is closed before its directory goes
+        self.addCleanup(shutil.rmtree, tmpdir)
+        json_path = os.path.join(tmpdir, 'cves.json')
+        db_path = os.path.join(tmpdir, 'cves.db')
+        with open(json_path, 'w') as f:
+            json.dump(self.test_db_data, f)
+        
+        self.assertEqual(import_json(json_path, db_path), 2)
+        cve_db = CVEDatabase(db_path)
+        self.addCleanup(cve_db.close)
+        
+        self.assertEqual(cve_db.metadata["database_version"], "1.0.0")
+        vulns = cve_db.check_vulnerabilities("Geth", "1.10.7")
+        self.assertEqual([v.cve_id for v in vulns], ["CVE-2021-39137"])
+        self.assertEqual(cve_db.check_vulnerabilities("Geth", "1.10.8"), [])
+        self.assertEqual(cve_db.get_database_info()["total_vulnerabilities"], 2)
+        self.assertEqual(cve_db.get_vulnerability("CVE-2018-19486")[0], "parity")
     
     def test_database_loading(self):
         """Test that database loads correctly."""
@@ -148,61 +218,36 @@ class TestCVEDatabase(unittest.TestCase):
         self.assertEqual(len(self.cve_db.vulnerabilities['geth']), 1)
         self.assertEqual(len(self.cve_db.vulnerabilities['parity']), 1)
     
-    def test_software_name_normalization(self):
-        """Test software name normalization."""
-        test_cases = [
-            ("Geth", "geth"),
-            ("GETH", "geth"),
-            ("go-ethereum", "geth"),
-            ("Parity-Ethereum", "parity"),
-            ("OpenEthereum", "parity"),
-            ("Besu", "besu"),
-            ("Hyperledger_Besu", "besu"),
-            ("Nethermind", "nethermind"),
-            ("Unknown Client", "unknown client")
+    def test_software_keys_are_normalized_at_load(self):
+        """Test that aliased software sections are merged under the canonical name."""
+        data = copy.deepcopy(self.test_db_data)
+        data["vulnerabilities"]["Go-Ethereum"] = [
+            dict(data["vulnerabilities"]["geth"][0], cve_id="CVE-2099-0001")
         ]
+        cve_db = CVEDatabase.from_dict(data)
         
-        for input_name, expected in test_cases:
-            with self.subTest(input_name=input_name):
-                result = self.cve_db._normalize_software_name(input_name)
-                self.assertEqual(result, expected)
+        self.assertNotIn("go-ethereum", cve_db.vulnerabilities)
+        self.assertEqual(
+            sorted(v.cve_id for v in cve_db.vulnerabilities["geth"]),
+            ["CVE-2021-39137", "CVE-2099-0001"]
+        )
     
-    def test_version_parsing(self):
-        """Test version string parsing."""
-        test_cases = [
-            ("1.10.7", "1.10.7"),
-            ("v1.10.7", "1.10.7"),
-            ("1.10.7-stable", "1.10.7"),
-            ("1.10.7-beta", "1.10.7"),
-            ("1.10.7+build123", "1.10.7"),
-            ("2.2.4-alpha.1", "2.2.4"),
-            ("invalid-version", None)
-        ]
+    def test_version_parsing_is_memoized(self):
+        """Test that repeated version strings are served from the parse cache."""
+        self.cve_db._parse_version("1.10.7-stable")
+        hits = CVEDatabase._parse_version.cache_info().hits
         
-        for input_version, expected in test_cases:
-            with self.subTest(input_version=input_version):
-                result = self.cve_db._parse_version(input_version)
-                if expected is None:
-                    self.assertIsNone(result)
-                else:
-                    self.assertEqual(str(result), expected)
+        self.assertEqual(str(self.cve_db._parse_version("1.10.7-stable")), "1.10.7")
+        self.assertEqual(CVEDatabase._parse_version.cache_info().hits, hits + 1)
     
-    def test_version_range_checking(self):
-        """Test version range vulnerability checking."""
-        # Test vulnerable version
-        vulnerable_versions = ["1.10.0", "1.10.3", "1.10.7"]
-        for version in vulnerable_versions:
-            with self.subTest(version=version):
-                vulns = self.cve_db.check_vulnerabilities("Geth", version)
-                self.assertEqual(len(vulns), 1)
-                self.assertEqual(vulns[0].cve_id, "CVE-2021-39137")
+    def test_repeated_checks_are_cached(self):
+        """Test that repeated lookups reuse the cached result without sharing the list."""
+        first = self.cve_db.check_vulnerabilities("Geth", "1.10.3")
+        first.clear()
         
-        # Test safe versions
-        safe_versions = ["1.9.9", "1.10.8", "1.11.0"]
-        for version in safe_versions:
-            with self.subTest(version=version):
-                vulns = self.cve_db.check_vulnerabilities("Geth", version)
-                self.assertEqual(len(vulns), 0)
+        second = self.cve_db.check_vulnerabilities("go-ethereum", "1.10.3")
+        self.assertEqual([v.cve_id for v in second], ["CVE-2021-39137"])
+        self.assertIn(("geth", "1.10.3"), self.cve_db._check_cache)
     
     def test_unknown_software(self):
         """Test checking vulnerabilities for unknown software."""
@@ -211,8 +256,13 @@ class TestCVEDatabase(unittest.TestCase):
     
     def test_vulnerability_sorting(self):
         """Test that vulnerabilities are sorted by severity."""
-        # Add multiple vulnerabilities to test sorting
-        self.test_db_data["vulnerabilities"]["testsoftware"] = [
+        # Minimal database holding only the sorting fixtures
+        test_db_data = {
+            "metadata": self.test_db_data["metadata"],
+            "severity_mapping": self.test_db_data["severity_mapping"],
+            "vulnerabilities": {}
+        }
+        test_db_data["vulnerabilities"]["testsoftware"] = [
             {
                 "cve_id": "CVE-2021-LOW",
                 "title": "Low severity test",
@@ -254,11 +304,7 @@ class TestCVEDatabase(unittest.TestCase):
             }
         ]
         
-        # Recreate database with new data
-        with open(self.temp_db_file.name, 'w') as f:
-            json.dump(self.test_db_data, f)
-        
-        cve_db = CVEDatabase(self.temp_db_file.name)
+        cve_db = CVEDatabase.from_dict(test_db_data)
         vulns = cve_db.check_vulnerabilities("testsoftware", "1.0.1")
         
         # Check that vulnerabilities are sorted by severity (CRITICAL first)
@@ -302,14 +348,54 @@ class TestCVEDatabase(unittest.TestCase):
         # Search for non-existent term
         results = self.cve_db.search_vulnerabilities("nonexistent")
         self.assertEqual(len(results), 0)
+    
+    def test_get_vulnerability_by_cve_id(self):
+        """Test exact CVE ID lookup."""
+        software_name, vuln = self.cve_db.get_vulnerability("cve-2021-39137")
+        self.assertEqual(software_name, "geth")
+        self.assertEqual(vuln.cve_id, "CVE-2021-39137")
+        
+        self.assertIsNone(self.cve_db.get_vulnerability("CVE-1999-0001"))
+    
+    @cases(NAME_NORMALIZATION_CASES)
+    def test_software_name_normalization(self, input_name, expected):
+        """Test software name normalization."""
+        self.assertEqual(self.cve_db._normalize_software_name(input_name), expected)
+    
+    @cases(VERSION_PARSING_CASES)
+    def test_version_parsing(self, input_version, expected):
+        """Test version string parsing."""
+        result = self.cve_db._parse_version(input_version)
+        if expected is None:
+            self.assertIsNone(result)
+        else:
+            self.assertEqual(str(result), expected)
+    
+    @cases(GETH_RANGE_CASES)
+    def test_version_range_checking(self, version, expected_cves):
+        """Test version range vulnerability checking."""
+        vulns = self.cve_db.check_vulnerabilities("Geth", version)
+        self.assertEqual([v.cve_id for v in vulns], expected_cves)
+    
+    def test_batch_version_range_checking(self):
+        """Test that the batch API matches per-version checks."""
+        pairs = [("Geth", version) for version, _ in GETH_RANGE_CASES]
+        
+        results = self.cve_db.check_vulnerabilities_batch(pairs + [("go-ethereum", "1.10.7")])
+        
+        for version, expected_cves in GETH_RANGE_CASES:
+            self.assertEqual([v.cve_id for v in results[("Geth", version)]], expected_cves)
+        self.assertEqual([v.cve_id for v in results[("go-ethereum", "1.10.7")]], ["CVE-2021-39137"])
 
 
+@pytest.mark.slow
 class TestCVEIntegration(unittest.TestCase):
     """Test CVE integration with fingerprinter."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.fingerprinter = EthereumRPCFingerprinter()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a fingerprinter, loading the real CVE database once for the class."""
+        cls.fingerprinter = EthereumRPCFingerprinter(defer_cve=False)
     
     def test_risk_level_calculation(self):
         """Test security risk level calculation."""
@@ -402,6 +488,7 @@ class TestCVEIntegration(unittest.TestCase):
         self.assertEqual(result.security_risk_level, "HIGH")
 
 
+@pytest.mark.slow
 class TestConvenienceFunction(unittest.TestCase):
     """Test convenience function for CVE checking."""
     
@@ -3,6 +3,7 @@
 Test script for the Ethereum RPC Fingerprinting Tool
 """
 
+from dataclasses import fields
 from ethereum_rpc_fingerprinter import EthereumRPCFingerprinter, print_fingerprint_result
 import json
 
@@ -12,7 +13,7 @@ def test_basic_functionality():
     print("=" * 50)
     
     # Create fingerprinter instance
-    fingerprinter = EthereumRPCFingerprinter(timeout=5)
+    fingerprinter = EthereumRPCFingerprinter(timeout=5, defer_cve=True)
     
     # Test endpoints (these will likely fail but show the structure)
     test_endpoints = [
@@ -66,14 +67,13 @@ def test_import_structure():
         print("✅ All imports successful")
         
         # Test creating instances
-        sync_fp = EthereumRPCFingerprinter()
+        sync_fp = EthereumRPCFingerprinter(defer_cve=True)
         async_fp = AsyncEthereumRPCFingerprinter()
         print("✅ Instance creation successful")
         
         # Test result structure
         result = FingerprintResult(endpoint="test://example")
-        result_dict = result.__dict__
-        print(f"✅ FingerprintResult has {len(result_dict)} fields")
+        print(f"✅ FingerprintResult has {len(fields(result))} fields")
         
         return True
         
@@ -5,11 +5,14 @@ These tests require actual network connectivity and running Ethereum nodes.
 """
 
 import unittest
-import asyncio
 import os
+import pytest
 from ethereum_rpc_fingerprinter import EthereumRPCFingerprinter, AsyncEthereumRPCFingerprinter
+from test_rpc_networking import FakeAdapter, mount_fake_adapter
+from _asyncutil import run_async
 
 
+@pytest.mark.network
 class TestRealWorldIntegration(unittest.TestCase):
     """Integration tests with real endpoints (if available)."""
     
@@ -135,14 +138,10 @@ class TestRealWorldIntegration(unittest.TestCase):
                                   ['connection', 'refused', 'timeout', 'unreachable']))
         
         # Run the async test
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(async_test())
-        finally:
-            loop.close()
+        run_async(async_test())
 
 
+@pytest.mark.network
 class TestPerformanceAndLimits(unittest.TestCase):
     """Test performance characteristics and limits."""
     
@@ -179,6 +178,7 @@ class TestPerformanceAndLimits(unittest.TestCase):
             "http://127.0.0.1:8545"
         ]
         
+        adapter = mount_fake_adapter(self.fingerprinter, FakeAdapter())
         results = []
         for endpoint in endpoints:
             result = self.fingerprinter.fingerprint(endpoint)
@@ -187,16 +187,40 @@ class TestPerformanceAndLimits(unittest.TestCase):
         # All should return FingerprintResult objects
         self.assertEqual(len(results), len(endpoints))
         
+        # Basic node information and method discovery cost one batch request each per endpoint
+        self.assertEqual(adapter.batch_count, 2 * len(endpoints))
+        
         for i, result in enumerate(results):
             with self.subTest(endpoint=endpoints[i]):
                 self.assertEqual(result.endpoint, endpoints[i])
                 self.assertIsInstance(result.errors, list)
+                self.assertEqual(result.chain_id, 1)
         
         print(f"  ✅ Processed {len(results)} endpoints successfully")
     
+    def test_concurrent_endpoint_handling(self):
+        """Test handling multiple endpoints concurrently on one event loop."""
+        endpoints = [
+            "http://localhost:8545",
+            "http://localhost:8546", 
+            "http://127.0.0.1:8545"
+        ]
+        async_fingerprinter = AsyncEthereumRPCFingerprinter(timeout=5, max_concurrent=len(endpoints))
+        
+        results = run_async(async_fingerprinter.fingerprint_multiple(endpoints, show_progress=False))
+        run_async(async_fingerprinter.aclose())
+        
+        # Results come back in input order, one per endpoint
+        self.assertEqual([result.endpoint for result in results], endpoints)
+        for result in results:
+            with self.subTest(endpoint=result.endpoint):
+                self.assertIsInstance(result.errors, list)
+        
+        print(f"  ✅ Processed {len(results)} endpoints concurrently")
+    
     def test_memory_usage_with_large_error_lists(self):
         """Test that large error lists don't cause memory issues."""
-        from ethereum_rpc_fingerprinter import FingerprintResult
+        from ethereum_rpc_fingerprinter import FingerprintResult, _MAX_ERRORS
         
         result = FingerprintResult(endpoint="http://test.com")
         
@@ -204,7 +228,15 @@ class TestPerformanceAndLimits(unittest.TestCase):
         for i in range(1000):
             result.errors.append(f"Error {i}: Connection failed to simulate large error list")
         
-        self.assertEqual(len(result.errors), 1000)
+        self.assertEqual(len(result.errors), min(1000, _MAX_ERRORS))
+        
+        # Past the cap the oldest errors are dropped first
+        for i in range(1000, 1100):
+            result.errors.append(f"Error {i}: Connection failed to simulate large error list")
+        
+        self.assertEqual(len(result.errors), _MAX_ERRORS)
+        self.assertTrue(result.errors[0].startswith(f"Error {1100 - _MAX_ERRORS}:"))
+        self.assertTrue(result.errors[-1].startswith("Error 1099:"))
         
         # Should still be functional
         result.client_version = "TestClient/v1.0.0"
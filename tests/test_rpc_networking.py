@@ -3,11 +3,119 @@
 Unit tests for RPC networking functionality.
 """
 
+import asyncio
+import json
+import time
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 import requests
+from requests.adapters import HTTPAdapter
 import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from ethereum_rpc_fingerprinter import EthereumRPCFingerprinter, AsyncEthereumRPCFingerprinter
+from ethereum_rpc_fingerprinter import FingerprintResult, _extract_rpc_result, _fingerprint_threaded, _MISSING
+from ethereum_rpc_fingerprinter import _STANDARD_METHODS, _BATCH_CONVERTERS, _apply_batch_info
+from _asyncutil import run_async
+
+
+# Canned answers of the small Geth node served by FakeAdapter
+FAKE_NODE_RESULTS = {
+    "web3_clientVersion": "Geth/v1.10.7-stable/linux-amd64/go1.16.5",
+    "net_version": "1",
+    "eth_chainId": "0x1",
+    "eth_blockNumber": "0x10",
+    "eth_gasPrice": "0x3b9aca00",
+    "net_peerCount": "0x5",
+    "eth_syncing": False,
+    "eth_mining": False,
+    "eth_hashrate": "0x0",
+    "eth_accounts": ["0x00000000000000000000000000000000000000aa"],
+    "eth_protocolVersion": "0x41",
+}
+
+
+class FakeAdapter(HTTPAdapter):
+    """
+    In-process transport for a requests session.
+    
+    Records each JSON-RPC request body, then either raises ``exc`` (when given)
+    or answers the call, single or batched, from FAKE_NODE_RESULTS. Batch
+    replies are cut to their first ``batch_limit`` answers when it is given.
+    """
+    
+    def __init__(self, exc=None, batch_support=True, batch_limit=None):
+        super().__init__()
+        self.exc = exc
+        self.batch_support = batch_support
+        self.batch_limit = batch_limit
+        self.bodies = []
+    
+    @staticmethod
+    def _answer(call):
+        if call["method"] in FAKE_NODE_RESULTS:
+            return {"jsonrpc": "2.0", "id": call["id"], "result": FAKE_NODE_RESULTS[call["method"]]}
+        return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601, "message": "Method not found"}}
+    
+    def send(self, request, **kwargs):
+        body = json.loads(request.body)
+        self.bodies.append(body)
+        if self.exc is not None:
+            raise self.exc
+        
+        if not isinstance(body, list):
+            reply = self._answer(body)
+        elif self.batch_support:
+            # Answer out of order, as servers are allowed to
+            reply = [self._answer(call) for call in reversed(body)][:self.batch_limit]
+        else:
+            reply = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}}
+        
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(reply).encode()
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+    
+    @property
+    def batch_count(self):
+        """Number of JSON-RPC batch requests received."""
+        return sum(1 for body in self.bodies if isinstance(body, list))
+
+
+def fake_node_app(status=200, batch_support=True, bodies=None, batch_status=200):
+    """
+    aiohttp application answering JSON-RPC like FakeAdapter, or failing with ``status``.
+    
+    Batch bodies alone are refused with ``batch_status`` when it is not 200.
+    Request bodies are appended to ``bodies`` when given; any path is served.
+    """
+    async def handle(request):
+        body = await request.json()
+        if bodies is not None:
+            bodies.append(body)
+        if status != 200:
+            return web.Response(status=status)
+        if isinstance(body, list) and batch_status != 200:
+            return web.Response(status=batch_status)
+        if not isinstance(body, list):
+            return web.json_response(FakeAdapter._answer(body))
+        if batch_support:
+            return web.json_response([FakeAdapter._answer(call) for call in reversed(body)])
+        return web.json_response({"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}})
+    
+    app = web.Application()
+    app.router.add_post("/{path:.*}", handle)
+    return app
+
+
+def mount_fake_adapter(fingerprinter, adapter):
+    """Route every request of a fingerprinter's session through ``adapter``."""
+    fingerprinter.session.mount("http://", adapter)
+    fingerprinter.session.mount("https://", adapter)
+    return adapter
 
 
 class TestNetworkingFunctionality(unittest.TestCase):
@@ -22,17 +130,36 @@ class TestNetworkingFunctionality(unittest.TestCase):
         self.assertEqual(self.fingerprinter.timeout, 5)
         self.assertIsNotNone(self.fingerprinter.session)
     
+    def test_shared_cve_database(self):
+        """Test that an already loaded CVE database is reused instead of reloaded."""
+        fingerprinter = EthereumRPCFingerprinter(timeout=5, cve_database=self.fingerprinter.cve_database)
+        self.assertIs(fingerprinter.cve_database, self.fingerprinter.cve_database)
+    
+    def test_shared_session(self):
+        """Test that a given session is reused instead of creating a new one."""
+        fingerprinter = EthereumRPCFingerprinter(timeout=5, cve_database=self.fingerprinter.cve_database,
+                                                 session=self.fingerprinter.session)
+        self.assertIs(fingerprinter.session, self.fingerprinter.session)
+    
+    def test_deferred_cve_database(self):
+        """Test that defer_cve postpones loading the CVE database until first use."""
+        with patch('ethereum_rpc_fingerprinter.CVEDatabase') as mock_db:
+            fingerprinter = EthereumRPCFingerprinter(timeout=5, defer_cve=True)
+            mock_db.assert_not_called()
+            
+            self.assertIs(fingerprinter.cve_database, mock_db.return_value)
+            self.assertIs(fingerprinter.cve_database, mock_db.return_value)
+            mock_db.assert_called_once_with()
+    
     def test_timeout_configuration(self):
         """Test that timeout is properly configured."""
         custom_timeout = 30
         fingerprinter = EthereumRPCFingerprinter(timeout=custom_timeout)
         self.assertEqual(fingerprinter.timeout, custom_timeout)
     
-    @patch('requests.Session.post')
-    def test_connection_error_handling(self, mock_post):
+    def test_connection_error_handling(self):
         """Test handling of connection errors."""
-        # Mock connection error
-        mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        mount_fake_adapter(self.fingerprinter, FakeAdapter(requests.exceptions.ConnectionError("Connection refused")))
         
         result = self.fingerprinter.fingerprint("http://invalid-endpoint:8545")
         
@@ -42,11 +169,9 @@ class TestNetworkingFunctionality(unittest.TestCase):
         self.assertIsInstance(result.errors, list)
         self.assertGreater(len(result.errors), 0)
     
-    @patch('requests.Session.post')
-    def test_timeout_error_handling(self, mock_post):
+    def test_timeout_error_handling(self):
         """Test handling of timeout errors."""
-        # Mock timeout error
-        mock_post.side_effect = requests.exceptions.Timeout("Request timeout")
+        mount_fake_adapter(self.fingerprinter, FakeAdapter(requests.exceptions.Timeout("Request timeout")))
         
         result = self.fingerprinter.fingerprint("http://timeout-endpoint:8545")
         
@@ -73,6 +198,156 @@ class TestNetworkingFunctionality(unittest.TestCase):
         self.assertEqual(result.endpoint, "http://definitely-invalid-endpoint.test:8545")
         self.assertIsInstance(result.errors, list)
 
+    
+    def test_basic_info_uses_one_batch_request(self):
+        """Test that basic node information is fetched in a single JSON-RPC batch."""
+        adapter = mount_fake_adapter(self.fingerprinter, FakeAdapter())
+        result = self.fingerprinter.fingerprint("http://node.test:8545")
+        
+        # One batch for basic information, one for method discovery
+        self.assertEqual(adapter.batch_count, 2)
+        self.assertEqual(result.node_implementation, "Geth")
+        self.assertEqual(result.node_version, "1.10.7-stable")
+        self.assertEqual(result.network_id, "1")
+        self.assertEqual(result.chain_id, 1)
+        self.assertEqual(result.gas_price, 1000000000)
+        self.assertEqual(result.peer_count, 5)
+        self.assertIs(result.syncing, False)
+        self.assertEqual(result.accounts, ["0x00000000000000000000000000000000000000AA"])
+        self.assertEqual(result.protocol_version, "0x41")
+        self.assertEqual(result.errors, [])
+    
+    def test_basic_info_falls_back_without_batch_support(self):
+        """Test that nodes rejecting batches are queried one method at a time."""
+        mount_fake_adapter(self.fingerprinter, FakeAdapter(batch_support=False))
+        result = self.fingerprinter.fingerprint("http://node.test:8545")
+        
+        self.assertEqual(result.client_version, FAKE_NODE_RESULTS["web3_clientVersion"])
+        self.assertEqual(result.chain_id, 1)
+        self.assertEqual(result.block_number, 16)
+    
+    def test_method_discovery_uses_one_batch_request(self):
+        """Test that method discovery probes every standard method in one batch."""
+        adapter = mount_fake_adapter(self.fingerprinter, FakeAdapter())
+        methods = self.fingerprinter._discover_methods("http://node.test:8545")
+        
+        self.assertEqual(adapter.batch_count, 1)
+        self.assertEqual(len(adapter.bodies[0]), len(_STANDARD_METHODS))
+        self.assertEqual(methods, [m for m in _STANDARD_METHODS if m in FAKE_NODE_RESULTS])
+    
+    def test_method_discovery_falls_back_without_batch_support(self):
+        """Test that nodes rejecting batches are probed one method at a time."""
+        adapter = mount_fake_adapter(self.fingerprinter, FakeAdapter(batch_support=False))
+        methods = self.fingerprinter._discover_methods("http://node.test:8545")
+        
+        self.assertEqual(len(adapter.bodies), 1 + len(_STANDARD_METHODS))
+        self.assertEqual(methods, [m for m in _STANDARD_METHODS if m in FAKE_NODE_RESULTS])
+    
+    def test_method_discovery_reprobes_answers_missing_from_batch(self):
+        """Test that methods lost from a truncated batch reply are probed on their own."""
+        adapter = mount_fake_adapter(self.fingerprinter, FakeAdapter(batch_limit=10))
+        methods = self.fingerprinter._discover_methods("http://node.test:8545")
+        
+        # The batch, then one call for every method beyond the ten answered ones
+        self.assertEqual(len(adapter.bodies), 1 + len(_STANDARD_METHODS) - 10)
+        self.assertEqual(methods, [m for m in _STANDARD_METHODS if m in FAKE_NODE_RESULTS])
+    
+    def test_result_cache_reuses_recent_results(self):
+        """Test that cache_ttl serves repeat fingerprints without new requests."""
+        fingerprinter = EthereumRPCFingerprinter(timeout=5, cve_database=self.fingerprinter.cve_database, cache_ttl=60)
+        adapter = mount_fake_adapter(fingerprinter, FakeAdapter())
+        
+        first = fingerprinter.fingerprint("http://node.test:8545")
+        requests_made = len(adapter.bodies)
+        first.errors.append("caller change")
+        second = fingerprinter.fingerprint("http://node.test:8545")
+        
+        self.assertEqual(len(adapter.bodies), requests_made)
+        self.assertEqual(second.client_version, FAKE_NODE_RESULTS["web3_clientVersion"])
+        self.assertNotIn("caller change", second.errors)
+        
+        # Expired entries are probed again
+        with patch('ethereum_rpc_fingerprinter.time.monotonic', return_value=float('inf')):
+            fingerprinter.fingerprint("http://node.test:8545")
+        self.assertGreater(len(adapter.bodies), requests_made)
+    
+    def test_result_cache_is_bounded(self):
+        """Test that the result cache evicts its oldest entries and drops expired ones."""
+        fingerprinter = EthereumRPCFingerprinter(timeout=5, cve_database=self.fingerprinter.cve_database, cache_ttl=60)
+        mount_fake_adapter(fingerprinter, FakeAdapter())
+        
+        with patch('ethereum_rpc_fingerprinter._RESULT_CACHE_SIZE', 2):
+            for host in ("a", "b", "c"):
+                fingerprinter.fingerprint(f"http://{host}.test:8545")
+        self.assertEqual(list(fingerprinter._result_cache), ["http://b.test:8545", "http://c.test:8545"])
+        
+        with patch('ethereum_rpc_fingerprinter.time.monotonic', return_value=float('inf')), \
+                patch.object(fingerprinter, '_fingerprint_endpoint',
+                             return_value=FingerprintResult(endpoint="http://b.test:8545")):
+            fingerprinter.fingerprint("http://b.test:8545")
+        self.assertEqual(list(fingerprinter._result_cache), ["http://c.test:8545"])
+    
+    def test_batch_errors_are_reported_per_method(self):
+        """Test that one failing method in a batch does not fail the others."""
+        responses = {
+            "eth_chainId": {"jsonrpc": "2.0", "id": 2, "result": "0x89"},
+            "eth_mining": {"jsonrpc": "2.0", "id": 7, "error": {"code": -32601, "message": "Method not found"}},
+        }
+        result = FingerprintResult(endpoint="http://node.test:8545", errors=[])
+        
+        _apply_batch_info(result, responses, self.fingerprinter._parse_client_version,
+                          converters=_BATCH_CONVERTERS, report_rpc_errors=True)
+        
+        self.assertEqual(result.chain_id, 137)
+        self.assertIn("Failed to get mining status: Method not found", result.errors)
+        self.assertIn("Failed to get client version: no response in batch", result.errors)
+    
+    def test_probe_cache_serves_repeat_identity_probes(self):
+        """Test that cached identity answers are not requested from the node again."""
+        adapter = mount_fake_adapter(self.fingerprinter, FakeAdapter())
+        calls = [("web3_clientVersion", []), ("eth_chainId", []), ("eth_blockNumber", [])]
+        
+        first = self.fingerprinter._batch_rpc("http://node.test:8545", calls)
+        second = self.fingerprinter._batch_rpc("http://node.test:8545", calls)
+        
+        self.assertEqual(len(adapter.bodies), 1)
+        self.assertEqual(second, first)
+        
+        # The head block expires after a second; identity answers never do
+        with patch('ethereum_rpc_fingerprinter.time.monotonic', return_value=time.monotonic() + 5):
+            third = self.fingerprinter._batch_rpc("http://node.test:8545", calls)
+        self.assertEqual(len(adapter.bodies), 2)
+        self.assertEqual([call["method"] for call in adapter.bodies[1]], ["eth_blockNumber"])
+        self.assertEqual({method: response["result"] for method, response in third.items()},
+                         {method: response["result"] for method, response in first.items()})
+    
+    def test_probe_cache_skips_errors_and_other_endpoints(self):
+        """Test that error answers are not cached and entries are per endpoint."""
+        adapter = mount_fake_adapter(self.fingerprinter, FakeAdapter())
+        calls = [("net_version", []), ("eth_mining", [])]
+        
+        self.fingerprinter._batch_rpc("http://node.test:8545", calls + [("parity_versionInfo", [])])
+        self.fingerprinter._batch_rpc("http://node.test:8545", [("parity_versionInfo", [])])
+        self.fingerprinter._batch_rpc("http://other.test:8545", calls)
+        
+        self.assertEqual(len(adapter.bodies), 3)
+        self.assertEqual([call["method"] for call in adapter.bodies[2]], ["net_version", "eth_mining"])
+    
+    def test_threaded_fingerprinting_preserves_order(self):
+        """Test that thread-pooled fingerprinting returns results in input order."""
+        endpoints = [f"http://node-{i}.test:8545" for i in range(8)]
+        completed = []
+        
+        def make_fingerprinter():
+            fingerprinter = Mock()
+            fingerprinter.fingerprint = lambda endpoint: FingerprintResult(endpoint=endpoint, errors=[])
+            return fingerprinter
+        
+        results = _fingerprint_threaded(make_fingerprinter, endpoints, 4, on_done=lambda: completed.append(1))
+        
+        self.assertEqual([r.endpoint for r in results], endpoints)
+        self.assertEqual(len(completed), len(endpoints))
+
 
 class TestAsyncNetworkingFunctionality(unittest.TestCase):
     """Test async networking functionality."""
@@ -81,10 +356,61 @@ class TestAsyncNetworkingFunctionality(unittest.TestCase):
         """Set up test fixtures."""
         self.async_fingerprinter = AsyncEthereumRPCFingerprinter(timeout=5, max_concurrent=2)
     
+    def tearDown(self):
+        """Release the fingerprinter's HTTP session."""
+        run_async(self.async_fingerprinter.aclose())
+    
     def test_async_fingerprinter_initialization(self):
         """Test async fingerprinter initialization."""
         self.assertEqual(self.async_fingerprinter.timeout, 5)
         self.assertEqual(self.async_fingerprinter.max_concurrent, 2)
+        self.assertFalse(self.async_fingerprinter.ipv4_only)
+        self.assertIsNone(self.async_fingerprinter._session)
+    
+    def test_session_reused_across_runs(self):
+        """Test that repeated fingerprint_multiple calls share one session and connector."""
+        async def fake_single(session, endpoint):
+            return FingerprintResult(endpoint=endpoint, errors=[])
+        
+        self.async_fingerprinter._fingerprint_single = fake_single
+        
+        run_async(self.async_fingerprinter.fingerprint_multiple(["http://node-0.test:8545"], show_progress=False))
+        session = self.async_fingerprinter._session
+        connector = self.async_fingerprinter._connector
+        self.assertIsNotNone(connector)
+        self.assertEqual(connector.limit_per_host, 2)
+        
+        run_async(self.async_fingerprinter.fingerprint_multiple(["http://node-1.test:8545"], show_progress=False))
+        self.assertIs(self.async_fingerprinter._session, session)
+        self.assertIs(self.async_fingerprinter._connector, connector)
+        
+        run_async(self.async_fingerprinter.aclose())
+        self.assertTrue(session.closed)
+        self.assertIsNone(self.async_fingerprinter._session)
+    
+    def test_async_context_manager_closes_session(self):
+        """Test that leaving the async context closes the session."""
+        async def run():
+            async with AsyncEthereumRPCFingerprinter(timeout=5) as fingerprinter:
+                session = await fingerprinter._get_session()
+                self.assertFalse(session.closed)
+            return session
+        
+        self.assertTrue(run_async(run()).closed)
+    
+    def test_session_from_another_loop_is_closed_before_replacing(self):
+        """Test that switching event loops closes the stale session instead of leaking it."""
+        old_loop = asyncio.new_event_loop()
+        try:
+            stale = old_loop.run_until_complete(self.async_fingerprinter._get_session())
+        finally:
+            old_loop.close()
+        
+        session = run_async(self.async_fingerprinter._get_session())
+        
+        self.assertTrue(stale.closed)
+        self.assertIsNot(session, stale)
+        self.assertFalse(session.closed)
     
     def test_async_fingerprinter_has_required_methods(self):
         """Test that async fingerprinter has required methods."""
@@ -95,11 +421,124 @@ class TestAsyncNetworkingFunctionality(unittest.TestCase):
         import inspect
         self.assertTrue(inspect.iscoroutinefunction(self.async_fingerprinter.fingerprint_multiple))
     
+    def test_fingerprint_multiple_against_local_node(self):
+        """Test async fingerprinting end to end against an in-process JSON-RPC server."""
+        async def run():
+            async with TestServer(fake_node_app()) as server:
+                endpoint = str(server.make_url("/"))
+                return endpoint, await self.async_fingerprinter.fingerprint_multiple([endpoint], show_progress=False)
+        
+        endpoint, (result,) = run_async(run())
+        
+        self.assertEqual(result.endpoint, endpoint)
+        self.assertEqual(result.client_version, FAKE_NODE_RESULTS["web3_clientVersion"])
+        self.assertEqual(result.node_implementation, "Geth")
+        self.assertEqual(result.chain_id, 1)
+        self.assertEqual(result.block_number, 16)
+        self.assertEqual(result.errors, [])
+    
+    def test_fingerprint_multiple_sends_one_batch_per_endpoint(self):
+        """Test that each endpoint costs one batch request, with endpoints probed concurrently."""
+        bodies = []
+        
+        async def run():
+            async with TestServer(fake_node_app(bodies=bodies)) as server:
+                endpoints = [str(server.make_url(f"/node-{i}")) for i in range(3)]
+                return await self.async_fingerprinter.fingerprint_multiple(endpoints, show_progress=False)
+        
+        results = run_async(run())
+        
+        self.assertEqual(len(bodies), 3)
+        self.assertTrue(all(isinstance(body, list) for body in bodies))
+        for result in results:
+            self.assertEqual(result.node_implementation, "Geth")
+            self.assertEqual(result.network_id, 1)
+            self.assertEqual(result.accounts, FAKE_NODE_RESULTS["eth_accounts"])
+            self.assertEqual(result.errors, [])
+    
+    def test_fingerprint_falls_back_without_batch_support(self):
+        """Test that nodes rejecting batches are queried one method at a time."""
+        bodies = []
+        
+        async def run():
+            async with TestServer(fake_node_app(batch_support=False, bodies=bodies)) as server:
+                return await self.async_fingerprinter.fingerprint(str(server.make_url("/")))
+        
+        result = run_async(run())
+        
+        # The rejected batch, then web3_clientVersion and each remaining method on its own
+        self.assertEqual(len(bodies), 1 + len(FAKE_NODE_RESULTS))
+        self.assertEqual(result.client_version, FAKE_NODE_RESULTS["web3_clientVersion"])
+        self.assertEqual(result.block_number, 16)
+        self.assertEqual(result.errors, [])
+    
+    def test_batch_and_fallback_agree_on_unsupported_methods(self):
+        """Test that error answers are skipped alike whether or not the node takes batches."""
+        def fingerprint(batch_support):
+            async def run():
+                async with TestServer(fake_node_app(batch_support=batch_support)) as server:
+                    return await self.async_fingerprinter.fingerprint(str(server.make_url("/")))
+            return run_async(run())
+        
+        with patch.dict(FAKE_NODE_RESULTS):
+            del FAKE_NODE_RESULTS["eth_mining"], FAKE_NODE_RESULTS["eth_hashrate"]
+            batched, fallback = fingerprint(True), fingerprint(False)
+        
+        for result in (batched, fallback):
+            self.assertEqual(result.errors, [])
+            self.assertIsNone(result.mining)
+            self.assertEqual(result.chain_id, 1)
+    
+    def test_fingerprint_multiple_reports_http_errors(self):
+        """Test that a non-200 answer is reported once the single-call fallback fails too."""
+        bodies = []
+        
+        async def run():
+            async with TestServer(fake_node_app(status=503, bodies=bodies)) as server:
+                return await self.async_fingerprinter.fingerprint_multiple([str(server.make_url("/"))], show_progress=False)
+        
+        (result,) = run_async(run())
+        
+        self.assertIsNone(result.client_version)
+        self.assertEqual(result.errors, ["HTTP 503"])
+        # The rejected batch, then the web3_clientVersion fallback; nothing further is probed
+        self.assertEqual(len(bodies), 2)
+        self.assertIsInstance(bodies[0], list)
+        self.assertEqual(bodies[1]["method"], "web3_clientVersion")
+    
+    def test_rejected_batch_falls_back_to_single_calls(self):
+        """Test that nodes refusing batch bodies with an HTTP error are probed one call at a time."""
+        async def run():
+            async with TestServer(fake_node_app(batch_status=400)) as server:
+                return await self.async_fingerprinter.fingerprint(str(server.make_url("/")))
+        
+        result = run_async(run())
+        
+        self.assertEqual(result.client_version, FAKE_NODE_RESULTS["web3_clientVersion"])
+        self.assertEqual(result.chain_id, 1)
+        self.assertEqual(result.errors, [])
+    
     def test_async_configuration(self):
         """Test async fingerprinter configuration options."""
         custom_fingerprinter = AsyncEthereumRPCFingerprinter(timeout=15, max_concurrent=5)
         self.assertEqual(custom_fingerprinter.timeout, 15)
         self.assertEqual(custom_fingerprinter.max_concurrent, 5)
+    
+    def test_batched_fingerprint_multiple_preserves_order(self):
+        """Test that endpoints submitted in waves come back in input order."""
+        endpoints = [f"http://node-{i}.test:8545" for i in range(7)]
+        
+        async def fake_single(session, endpoint):
+            return FingerprintResult(endpoint=endpoint, errors=[])
+        
+        self.async_fingerprinter._fingerprint_single = fake_single
+        
+        for show_progress in (False, True):
+            with self.subTest(show_progress=show_progress):
+                results = run_async(self.async_fingerprinter.fingerprint_multiple(
+                    endpoints, show_progress=show_progress, batch_size=3
+                ))
+                self.assertEqual([r.endpoint for r in results], endpoints)
 
 
 class TestMethodDetection(unittest.TestCase):
@@ -136,6 +575,33 @@ class TestMethodDetection(unittest.TestCase):
         self.assertIn('programming_language', result)
 
 
+class TestRPCResultExtraction(unittest.TestCase):
+    """Test extraction of JSON-RPC results from raw response bodies."""
+    
+    def test_client_version_fast_path(self):
+        """Test that client version strings are sliced from the raw body."""
+        body = b'{"jsonrpc":"2.0","id":1,"result":"Geth/v1.10.26-stable/linux-amd64/go1.18.5"}'
+        self.assertEqual(_extract_rpc_result(body, 'web3_clientVersion'),
+                         "Geth/v1.10.26-stable/linux-amd64/go1.18.5")
+        
+        # Escaped strings fall back to a full JSON parse
+        body = b'{"jsonrpc":"2.0","id":1,"result":"Custom\\"Client\\"/v1.0.0"}'
+        self.assertEqual(_extract_rpc_result(body, 'web3_clientVersion'), 'Custom"Client"/v1.0.0')
+    
+    def test_scalar_fast_path(self):
+        """Test extraction of hex, decimal and boolean results."""
+        self.assertEqual(_extract_rpc_result(b'{"result":"0x1"}', 'eth_chainId'), "0x1")
+        self.assertEqual(_extract_rpc_result(b'{"result": 25}', 'net_peerCount'), 25)
+        self.assertIs(_extract_rpc_result(b'{"result":false}', 'eth_mining'), False)
+        self.assertEqual(_extract_rpc_result(b'{"result":"1"}', 'net_version'), "1")
+    
+    def test_missing_result(self):
+        """Test that error responses yield the missing sentinel."""
+        body = b'{"jsonrpc":"2.0","id":1,"error":{"code":-32601,"message":"Method not found"}}'
+        self.assertIs(_extract_rpc_result(body, 'eth_chainId'), _MISSING)
+        self.assertIs(_extract_rpc_result(body, 'eth_accounts'), _MISSING)
+
+
 class TestErrorHandling(unittest.TestCase):
     """Test error handling scenarios."""
     
@@ -174,6 +640,21 @@ class TestErrorHandling(unittest.TestCase):
         self.assertIsInstance(result.errors, list)
         # Should have some error indicating connection failure
         self.assertGreater(len(result.errors), 0)
+    
+    def test_unreachable_endpoint_fails_after_one_request(self):
+        """Test that a refused connection ends fingerprinting with the reason."""
+        adapter = mount_fake_adapter(self.fingerprinter, FakeAdapter(requests.exceptions.ConnectionError("Connection refused")))
+        result = self.fingerprinter.fingerprint("http://node.test:8545")
+        
+        self.assertEqual(len(adapter.bodies), 1)
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue(result.errors[0].startswith("Unable to connect to endpoint"))
+        self.assertIn("Connection refused", result.errors[0])
+    
+    def test_connect_timeout_is_capped(self):
+        """Test that establishing a connection never waits longer than the cap."""
+        self.assertEqual(EthereumRPCFingerprinter(timeout=10, defer_cve=True)._request_timeout, (2.0, 10))
+        self.assertEqual(EthereumRPCFingerprinter(timeout=1, defer_cve=True)._request_timeout, (1, 1))
 
 
 if __name__ == '__main__':
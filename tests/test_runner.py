@@ -1,108 +1,503 @@
 #!/usr/bin/env python3
 """
 Test runner that executes all unit tests for the Ethereum RPC Fingerprinter.
+
+By default the whole suite runs under pytest, in parallel when pytest-xdist
+is installed. --unittest runs the TestCase classes with the stdlib runner
+instead, which does not collect module-level pytest test functions.
 """
 
+import importlib
+import inspect
+import io
+import json
+import multiprocessing
 import unittest
 import sys
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 
-# Add the parent directory to the path so we can import the fingerprinter
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Test and repository directories, resolved once; the repository root goes on
+# the path (only once, also when workers re-import this module) for the fingerprinter
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.dirname(_TESTS_DIR)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
-# Import all test modules
-from test_node_implementation import TestNodeImplementationDetection
-from test_client_version_parsing import TestClientVersionParsing
-from test_fingerprint_result import TestFingerprintResult, TestFingerprintResultIntegration
-from test_rpc_networking import TestNetworkingFunctionality, TestAsyncNetworkingFunctionality, TestMethodDetection, TestErrorHandling
-from test_cve_database import TestVulnerabilityDataClass, TestCVEDatabase, TestCVEIntegration, TestConvenienceFunction
+# The TestCase classes of the default run, in run order, as (category, 'module.ClassName');
+# the source for the run order and the --list output. Classes discovered under
+# tests/ but missing here still run, after these. --list imports no test modules
+_TEST_REGISTRY = (
+    ("Node Implementation Detection", "test_node_implementation.TestNodeImplementationDetection"),
+    
+    ("Client Version Parsing", "test_client_version_parsing.TestClientVersionParsing"),
+    
+    ("FingerprintResult Data Structure", "test_fingerprint_result.TestFingerprintResult"),
+    ("FingerprintResult Data Structure", "test_fingerprint_result.TestFingerprintResultIntegration"),
+    
+    ("RPC Method Detection & Networking", "test_rpc_networking.TestMethodDetection"),
+    ("RPC Method Detection & Networking", "test_rpc_networking.TestRPCResultExtraction"),
+    ("RPC Method Detection & Networking", "test_rpc_networking.TestNetworkingFunctionality"),
+    ("RPC Method Detection & Networking", "test_rpc_networking.TestAsyncNetworkingFunctionality"),
+    ("RPC Method Detection & Networking", "test_rpc_networking.TestErrorHandling"),
+    
+    ("CVE Database & Vulnerabilities", "test_cve_database.TestVulnerabilityDataClass"),
+    ("CVE Database & Vulnerabilities", "test_cve_database.TestCVEDatabase"),
+    ("CVE Database & Vulnerabilities", "test_cve_database.TestCVEIntegration"),
+    ("CVE Database & Vulnerabilities", "test_cve_database.TestConvenienceFunction"),
+)
 
+TEST_CLASSES = tuple(class_fqname for _, class_fqname in _TEST_REGISTRY)
 
-def create_test_suite():
-    """Create a comprehensive test suite."""
-    suite = unittest.TestSuite()
+# (category, module) pairs for --list, in registry order
+_TEST_CATEGORIES = tuple(dict.fromkeys(
+    (category, class_fqname.rpartition(".")[0]) for category, class_fqname in _TEST_REGISTRY
+))
+
+_LOADER = unittest.TestLoader()
+
+# Setting this to 1 makes --fast the default, dropping the classes marked slow
+_FAST_ENV = "RPC_FINGERPRINT_FAST_TESTS"
+
+# Wall time of each class in the last full run; the pool starts the slowest classes first
+_TIMINGS_FILE = os.path.join(_TESTS_DIR, ".test_runner_timings.json")
+
+# Marks the message of a failed assertion in a failure traceback
+_ASSERTION_MARKER = 'AssertionError: '
+
+# Set by the first failing class of a --failfast pool run; every worker stops its
+# current class after the running test and skips the classes it has yet to start
+_stop_event = None
+
+# Tests whose progress output a _BufferedResult holds before writing it out
+_FLUSH_EVERY = 100
+
+# Most failures and errors listed one by one in the summary; the rest are only counted
+_MAX_LISTED = 50
+
+
+@lru_cache(maxsize=None)
+def _test_case_names(test_class):
+    """Names of the test methods of a TestCase class, scanned once per class."""
+    names = tuple(_LOADER.getTestCaseNames(test_class))
+    if not names and hasattr(test_class, 'runTest'):
+        names = ('runTest',)
+    return names
+
+
+def _import_class(class_fqname):
+    """Import the module of a 'module.ClassName' name and return the class."""
+    module_name, _, class_name = class_fqname.rpartition(".")
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def _has_mark(test_class, mark_name):
+    """Whether a TestCase class carries the named pytest marker."""
+    return any(mark.name == mark_name for mark in getattr(test_class, "pytestmark", ()))
+
+
+def _iter_tests(suite):
+    """Yield the individual tests of a possibly nested suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def _discover_class_names():
+    """
+    'module.ClassName' of every TestCase class in the tests/test_*.py modules.
     
-    # Add all test classes
-    test_classes = [
-        # Node implementation detection tests
-        TestNodeImplementationDetection,
-        
-        # Client version parsing tests
-        TestClientVersionParsing,
-        
-        # FingerprintResult tests
-        TestFingerprintResult,
-        TestFingerprintResultIntegration,
-        
-        # RPC and networking tests
-        TestMethodDetection,
-        TestNetworkingFunctionality,
-        TestAsyncNetworkingFunctionality,
-        TestErrorHandling,
-        
-        # CVE database and vulnerability tests
-        TestVulnerabilityDataClass,
-        TestCVEDatabase,
-        TestCVEIntegration,
-        TestConvenienceFunction,
-    ]
+    Classes marked as network tests are left out, like the registry leaves
+    them out; modules that fail to import are reported on stderr.
+    """
+    suite = _LOADER.discover(start_dir=_TESTS_DIR, pattern="test_*.py", top_level_dir=_TESTS_DIR)
+    for error in _LOADER.errors:
+        sys.stderr.write(f"⚠️  {error}\n")
+    del _LOADER.errors[:]
+    
+    test_classes = dict.fromkeys(
+        type(test) for test in _iter_tests(suite) if isinstance(test, unittest.TestCase)
+    )
+    return tuple(
+        f"{test_class.__module__}.{test_class.__qualname__}"
+        for test_class in test_classes
+        if test_class.__module__ != unittest.loader.__name__ and not _has_mark(test_class, "network")
+    )
+
+
+def _pytest_only_tests():
+    """
+    'module.function' of the module-level test functions in tests/test_*.py.
+    
+    unittest only runs TestCase classes, so these are left out by the
+    --unittest backend; modules that fail to import are skipped here, as
+    discovery already reported them.
+    """
+    names = []
+    for file_name in sorted(os.listdir(_TESTS_DIR)):
+        module_name, extension = os.path.splitext(file_name)
+        if not (module_name.startswith("test_") and extension == ".py") or module_name == __name__:
+            continue
+        try:
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
+        except Exception:
+            continue
+        names.extend(
+            f"{module_name}.{name}" for name, obj in vars(module).items()
+            if name.startswith("test") and inspect.isfunction(obj) and obj.__module__ == module_name
+        )
+    return names
+
+
+def _select(include_slow=True):
+    """
+    The 'module.ClassName' names to run: the registered classes, then any discovered ones.
+    
+    Without ``include_slow`` the classes marked slow are dropped.
+    """
+    names = TEST_CLASSES + tuple(
+        name for name in _discover_class_names() if name not in TEST_CLASSES
+    )
+    if include_slow:
+        return names
+    return tuple(name for name in names if not _has_mark(_import_class(name), "slow"))
+
+
+def _load(test_class):
+    """
+    Build a suite for a TestCase class from its memoized test method names.
+    
+    Suites drop their tests as they run, so only the names are cached and
+    fresh TestCase instances are created on every call.
+    """
+    return _LOADER.suiteClass(map(test_class, _test_case_names(test_class)))
+
+
+class _BufferedResult(unittest.TextTestResult):
+    """
+    TextTestResult that collects its progress output in memory and writes it out in batches.
+    
+    The stock result flushes its stream after every test; this one writes and
+    flushes once every _FLUSH_EVERY tests, at the end of the run and after the
+    error report, which saves a write and flush per test on a terminal or pipe.
+    """
+    
+    def __init__(self, stream, descriptions, verbosity, **kwargs):
+        super().__init__(stream, descriptions, verbosity, **kwargs)
+        self._target = stream
+        self._buffer = io.StringIO()
+        # Same writeln decorator the runner wrapped the real stream in
+        self.stream = type(stream)(self._buffer)
+    
+    def _flush(self):
+        output = self._buffer.getvalue()
+        if output:
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            self._target.write(output)
+            self._target.flush()
+    
+    def stopTest(self, test):
+        super().stopTest(test)
+        if self.testsRun % _FLUSH_EVERY == 0:
+            self._flush()
+    
+    def stopTestRun(self):
+        super().stopTestRun()
+        self._flush()
+    
+    def printErrors(self):
+        super().printErrors()
+        self._flush()
+
+
+def create_test_suite(include_slow=True):
+    """Create a comprehensive test suite, without the slow classes unless ``include_slow``."""
+    suite = unittest.TestSuite()
     
     # Load all test methods from each class
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
+    for class_fqname in _select(include_slow):
+        suite.addTests(_load(_import_class(class_fqname)))
     
     return suite
 
 
-def run_tests(verbosity=2):
-    """Run all tests with specified verbosity level."""
-    print("🧪 Running Ethereum RPC Fingerprinter Unit Tests")
-    print("=" * 60)
+def _preload(class_fqnames):
+    """
+    Import the fingerprinter and the test modules behind the given 'module.ClassName' names.
     
-    # Create and run the test suite
-    suite = create_test_suite()
-    runner = unittest.TextTestRunner(verbosity=verbosity, buffer=True)
+    Used as the worker initializer so the import cost is paid once per worker
+    process instead of once per task; under fork, preloading in the parent lets
+    every worker share the already imported modules copy-on-write.
+    """
+    importlib.import_module("ethereum_rpc_fingerprinter")
+    for module_name in dict.fromkeys(name.rpartition(".")[0] for name in class_fqnames):
+        importlib.import_module(module_name)
+
+
+def _init_worker(class_fqnames, stop_event=None):
+    """Pool initializer: preload the test modules and keep the shared --failfast stop event."""
+    global _stop_event
+    _stop_event = stop_event
+    _preload(class_fqnames)
+
+
+class _StopOnEventResult(_BufferedResult):
+    """_BufferedResult that stops its run once another worker has set the --failfast stop event."""
+    
+    def stopTest(self, test):
+        super().stopTest(test)
+        if _stop_event is not None and _stop_event.is_set():
+            self.stop()
+
+
+def _pool_context():
+    """Fork on Linux so workers inherit preloaded modules; elsewhere the platform default (spawn)"""
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _run_one(class_fqname, verbosity=1, capture=False, failfast=False, stream=None):
+    """
+    Run one TestCase class, given as 'module.ClassName', and summarize the outcome.
+    
+    Progress output goes, in batches, to ``stream`` when given (in-process runs
+    pass the terminal) and is otherwise collected and returned as text.
+    
+    With ``capture`` the output of each test is buffered and only reported
+    for failing tests; otherwise tests write straight to the terminal.
+    With ``failfast`` the class stops at its first failure or error and, in a
+    pool, makes the other workers stop as well.
+    
+    Runs inside a worker process, so everything returned is plain picklable data:
+    (tests run, failures, errors, skipped count, runner output, seconds taken),
+    with failures and errors as (test description, traceback text) pairs.
+    """
+    start = time.perf_counter()
+    collected = io.StringIO() if stream is None else None
+    if failfast and _stop_event is not None and _stop_event.is_set():
+        return 0, [], [], 0, "", time.perf_counter() - start
+    
+    suite = _load(_import_class(class_fqname))
+    runner = unittest.TextTestRunner(stream=stream or collected, verbosity=verbosity, buffer=capture,
+                                     failfast=failfast, resultclass=_StopOnEventResult)
     result = runner.run(suite)
+    if failfast and _stop_event is not None and not result.wasSuccessful():
+        _stop_event.set()
+    return (
+        result.testsRun,
+        [(str(test), traceback) for test, traceback in result.failures],
+        [(str(test), traceback) for test, traceback in result.errors],
+        len(result.skipped),
+        collected.getvalue() if collected is not None else "",
+        time.perf_counter() - start,
+    )
+
+
+def _load_timings():
+    """Per-class durations recorded by the previous run, or {} on the first run."""
+    try:
+        with open(_TIMINGS_FILE, encoding="utf-8") as f:
+            timings = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return timings if isinstance(timings, dict) else {}
+
+
+def _save_timings(timings):
+    """Write the per-class durations atomically so a concurrent run never reads half a file."""
+    tmp_path = f"{_TIMINGS_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(timings, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, _TIMINGS_FILE)
+    except OSError:
+        # Timings only tune the scheduling order; a read-only checkout just loses them
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _iter_outcomes(names, verbosity, jobs, capture=False, failfast=False):
+    """
+    Yield (class name, _run_one outcome) for every class name as soon as it is available.
+    
+    Only one class's suite, captured output and result are alive at a time per
+    process, and the caller can drop each outcome before the next one arrives,
+    which keeps peak memory flat however many classes the run has.
+    
+    In-process runs keep the given order; the pool submits the classes that
+    took longest last time first (unknown ones keep their relative order), so
+    a slow class never starts at the end while the other workers sit idle.
+    """
+    jobs = min(len(names), jobs or os.cpu_count() or 1)
+    run_one = partial(_run_one, verbosity=verbosity, capture=capture, failfast=failfast)
+    
+    if jobs <= 1:
+        # Nothing to keep in order across processes, so tests report straight to the terminal
+        for name in names:
+            yield name, run_one(name, stream=sys.stderr)
+        return
+    
+    timings = _load_timings()
+    names = sorted(names, key=lambda name: -timings.get(name, 0))
+    context = _pool_context()
+    if context.get_start_method() == "fork":
+        _preload(names)
+    stop_event = context.Event() if failfast else None
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context,
+                             initializer=_init_worker, initargs=(names, stop_event)) as executor:
+        yield from zip(names, executor.map(run_one, names))
+
+
+def run_tests(verbosity=2, jobs=None, capture=False, include_slow=True, failfast=False):
+    """
+    Run all TestCase classes with the unittest runner, at the specified verbosity level.
+    
+    Module-level pytest test functions are not run; the summary names them so
+    the gap is visible, and run_pytest covers the whole suite.
+    
+    Each TestCase class runs in its own worker process, up to ``jobs`` at a time
+    (default: one per CPU core); ``jobs=1`` runs everything in this process.
+    ``capture`` buffers test output and shows it only for failing tests.
+    Without ``include_slow`` the classes marked slow are left out.
+    ``failfast`` stops the run at the first failure or error.
+    """
+    # Header and summary are each written in one piece so they never interleave with test output
+    sys.stdout.write("🧪 Running Ethereum RPC Fingerprinter Unit Tests\n" + "=" * 60 + "\n")
+    sys.stdout.flush()
+    
+    # Run the classes, one task per class; output is printed in run order as each class finishes
+    tests_run = skipped = 0
+    failures = []
+    errors = []
+    timings = {}
+    stopped = False
+    for name, outcome in _iter_outcomes(_select(include_slow), verbosity, jobs, capture, failfast):
+        class_tests_run, class_failures, class_errors, class_skipped, output, timings[name] = outcome
+        sys.stderr.write(output)
+        tests_run += class_tests_run
+        failures.extend(class_failures)
+        errors.extend(class_errors)
+        skipped += class_skipped
+        if failfast and (class_failures or class_errors):
+            # Leaving the generator cancels the classes the pool has not started yet
+            stopped = True
+            break
+    
+    # A cut-short run has no meaningful durations; a partial one (--fast) keeps the others
+    if not stopped:
+        _save_timings({**_load_timings(), **timings})
+    pytest_only = _pytest_only_tests()
     
     # Print summary
-    print("\n" + "=" * 60)
-    print("📊 Test Summary")
-    print("=" * 60)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped) if hasattr(result, 'skipped') else 0}")
+    n_failures = len(failures)
+    n_errors = len(errors)
+    lines = [
+        "",
+        "=" * 60,
+        "📊 Test Summary",
+        "=" * 60,
+        f"Tests run: {tests_run}",
+        f"Failures: {n_failures}",
+        f"Errors: {n_errors}",
+        f"Skipped: {skipped}",
+    ]
+    
+    if pytest_only:
+        lines.append(f"\n⚠️  Not run by the unittest backend ({len(pytest_only)} pytest-only tests, "
+                     f"run without --unittest to include them):")
+        lines.extend(f"  • {name}" for name in pytest_only)
     
-    if result.failures:
-        print(f"\n❌ Failures ({len(result.failures)}):")
-        for test, traceback in result.failures:
-            print(f"  • {test}: {traceback.split('AssertionError: ')[-1].split('\\n')[0] if 'AssertionError:' in traceback else 'See details above'}")
+    if n_failures:
+        lines.append(f"\n❌ Failures ({n_failures}):")
+        for test, traceback in islice(failures, _MAX_LISTED):
+            # First line of the last assertion message
+            _, found, message = traceback.rpartition(_ASSERTION_MARKER)
+            summary = message.partition('\n')[0] if found else 'See details above'
+            lines.append(f"  • {test}: {summary}")
+        if n_failures > _MAX_LISTED:
+            lines.append(f"  ... and {n_failures - _MAX_LISTED} more")
     
-    if result.errors:
-        print(f"\n💥 Errors ({len(result.errors)}):")
-        for test, traceback in result.errors:
-            print(f"  • {test}: {traceback.split('\\n')[-2] if len(traceback.split('\\n')) > 1 else 'Unknown error'}")
+    if n_errors:
+        lines.append(f"\n💥 Errors ({n_errors}):")
+        for test, traceback in islice(errors, _MAX_LISTED):
+            # Last line of the traceback names the exception
+            summary = traceback.rstrip('\n').rpartition('\n')[2] or 'Unknown error'
+            lines.append(f"  • {test}: {summary}")
+        if n_errors > _MAX_LISTED:
+            lines.append(f"  ... and {n_errors - _MAX_LISTED} more")
     
     # Overall result
-    if result.wasSuccessful():
-        print("\\n✅ All tests passed successfully!")
-        return 0
+    passed = not n_failures and not n_errors
+    if passed:
+        lines.append("\n✅ All tests passed successfully!")
     else:
-        print("\\n❌ Some tests failed. Please review the output above.")
+        lines.append("\n❌ Some tests failed. Please review the output above.")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0 if passed else 1
+
+
+def run_pytest(pytest_args=(), jobs=None, module_name=None):
+    """
+    Run the suite, or one test module, under pytest.
+    
+    With pytest-xdist installed the tests are spread over ``jobs`` workers
+    (default: one per CPU core; ``jobs=1`` runs in this process). With
+    --dist=loadfile every test module stays on one worker, so each worker
+    imports the fingerprinter and the CVE database once per module it runs.
+    """
+    try:
+        import pytest
+    except ImportError:
+        # Every test module needs pytest, so there is nothing meaningful to fall back to
+        print("❌ pytest is not installed; install the dev extra (pip install -e '.[dev]')")
         return 1
+    
+    if module_name is None:
+        args = [_TESTS_DIR]
+    else:
+        path = os.path.join(_TESTS_DIR, module_name.replace(".", os.sep) + ".py")
+        if not os.path.exists(path):
+            print(f"❌ Could not find test module '{module_name}' in {_TESTS_DIR}")
+            return 1
+        args = [path]
+    
+    try:
+        import xdist  # noqa: F401
+    except ImportError:
+        # pytest-xdist is optional; without it pytest runs the suite serially
+        pass
+    else:
+        if jobs is None:
+            args += ["-n", "auto", "--dist=loadfile"]
+        elif jobs > 1:
+            args += ["-n", str(jobs), "--dist=loadfile"]
+        else:
+            args += ["-n", "0"]
+    
+    return int(pytest.main(args + list(pytest_args)))
 
 
-def run_specific_test_module(module_name):
-    """Run tests from a specific module."""
+def run_specific_test_module(module_name, failfast=False):
+    """Run tests from a specific module, stopping at the first failure with ``failfast``."""
     print(f"🧪 Running tests from: {module_name}")
     print("=" * 60)
     
     # Import and run specific module
     try:
-        module = __import__(module_name)
-        suite = unittest.TestLoader().loadTestsFromModule(module)
-        runner = unittest.TextTestRunner(verbosity=2)
+        # import_module returns the named submodule itself, unlike __import__
+        module = sys.modules.get(module_name) or importlib.import_module(module_name)
+        suite = _LOADER.loadTestsFromModule(module)
+        runner = unittest.TextTestRunner(verbosity=2, failfast=failfast, resultclass=_BufferedResult)
         result = runner.run(suite)
         return 0 if result.wasSuccessful() else 1
     except ImportError as e:
@@ -115,20 +510,15 @@ def list_available_tests():
     print("📋 Available Test Categories:")
     print("=" * 60)
     
-    test_categories = [
-        ("Node Implementation Detection", "test_node_implementation"),
-        ("Client Version Parsing", "test_client_version_parsing"), 
-        ("FingerprintResult Data Structure", "test_fingerprint_result"),
-        ("RPC Method Detection & Networking", "test_rpc_networking"),
-    ]
-    
-    for category, module in test_categories:
+    for category, module in _TEST_CATEGORIES:
         print(f"• {category:.<45} {module}")
     
-    print("\\nTo run a specific category:")
+    print("\nTo run a specific category:")
     print("  python test_runner.py --module <module_name>")
-    print("\\nTo run all tests:")
+    print("\nTo run all tests (with pytest, in parallel when pytest-xdist is installed):")
     print("  python test_runner.py")
+    print("\nTo run only the TestCase classes with the unittest runner:")
+    print("  python test_runner.py --unittest")
 
 
 if __name__ == "__main__":
@@ -138,6 +528,17 @@ if __name__ == "__main__":
     parser.add_argument('--module', '-m', help='Run tests from specific module')
     parser.add_argument('--list', '-l', action='store_true', help='List available test modules')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Worker processes (default: one per CPU core, 1 = in-process)')
+    parser.add_argument('--unittest', action='store_true',
+                        help='Run only the TestCase classes with the unittest runner instead of pytest')
+    parser.add_argument('--capture', action='store_true',
+                        help='With --unittest, buffer test output and only show it for failing tests '
+                             '(implied by --verbose)')
+    parser.add_argument('--failfast', '-x', action='store_true',
+                        help='Stop at the first failing test')
+    parser.add_argument('--fast', action='store_true', default=os.environ.get(_FAST_ENV) == '1',
+                        help=f'Skip the slow CVE integration tests (default when {_FAST_ENV}=1)')
     
     args = parser.parse_args()
     
@@ -147,9 +548,17 @@ if __name__ == "__main__":
     
     verbosity = 2 if args.verbose else 1
     
-    if args.module:
-        exit_code = run_specific_test_module(args.module)
+    if not args.unittest:
+        pytest_args = ['-v'] if args.verbose else []
+        if args.fast:
+            pytest_args += ['-m', 'not slow']
+        if args.failfast:
+            pytest_args.append('-x')
+        exit_code = run_pytest(pytest_args, jobs=args.jobs, module_name=args.module)
+    elif args.module:
+        exit_code = run_specific_test_module(args.module, failfast=args.failfast)
     else:
-        exit_code = run_tests(verbosity)
+        exit_code = run_tests(verbosity, jobs=args.jobs, capture=args.capture or args.verbose,
+                              include_slow=not args.fast, failfast=args.failfast)
     
     sys.exit(exit_code)